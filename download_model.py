@@ -4,8 +4,12 @@ Script to download and extract the Vosk English model (en-gb-0.15)
 
 import os
 import sys
+import shutil
+import hashlib
 import zipfile
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from tqdm import tqdm
 
@@ -14,26 +18,194 @@ MODEL_URL = "https://alphacephei.com/vosk/models/vosk-model-small-en-gb-0.15.zip
 MODEL_DIR = "assets/models" 
 MODEL_PATH = os.path.join(MODEL_DIR, "vosk-model-small-en-gb-0.15")
 ZIP_PATH = os.path.join(MODEL_DIR, "vosk-model-small-en-gb-0.15.zip")
+COPY_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+PARALLEL_PARTS = 4
+# Pinned SHA-256 of the model archive (or pass --sha256). With None only the
+# per-member CRCs that zipfile checks during extraction protect the archive.
+MODEL_SHA256 = None
+
+
+class RangeNotHonoured(IOError):
+    """The server advertised byte ranges but answered a ranged GET without a 206"""
+
+
+def _part_path(destination):
+    """In-progress downloads live here until every byte has arrived"""
+    return destination + '.part'
 
 
 def download_file(url, destination):
-    """Download a file with progress bar"""
-    response = requests.get(url, stream=True)
-    total_size = int(response.headers.get('content-length', 0))
-
-    with open(destination, 'wb') as file, tqdm(
-        desc=os.path.basename(destination),
-        total=total_size,
-        unit='iB',
-        unit_scale=True,
-        unit_divisor=1024,
-    ) as bar:
-        for data in response.iter_content(chunk_size=1024):
-            size = file.write(data)
-            bar.update(size)
-
-
-def download_model():
+    """
+    Download a file with progress bar, resuming a partial download if present.
+    Returns the SHA-256 hex digest of the finished file, hashed as it streams.
+    """
+    part_path = _part_path(destination)
+    existing = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    headers = {'Range': f'bytes={existing}-'} if existing else {}
+    # Only the bytes already on disk from an earlier run are read back
+    digest = _sha256(part_path) if existing else hashlib.sha256()
+
+    with requests.get(url, headers=headers, stream=True) as response:
+        if existing and response.status_code == 416:
+            # Nothing left past our offset: only finished if the sizes agree
+            remote_size = response.headers.get('content-range', '').rpartition('/')[2]
+            if remote_size != str(existing):
+                os.remove(part_path)
+                raise IOError(
+                    f"Partial download is {existing} bytes but the server reports "
+                    f"{remote_size or 'an unknown size'}; discarded it, please retry"
+                )
+            os.replace(part_path, destination)
+            return digest.hexdigest()
+        response.raise_for_status()
+
+        if response.status_code == 206:
+            mode = 'ab'
+        else:
+            # Server ignored the Range header and sent the whole file; restart
+            existing = 0
+            mode = 'wb'
+            digest = hashlib.sha256()
+        total_size = existing + int(response.headers.get('content-length', 0))
+        response.raw.decode_content = True
+
+        # tqdm counts bytes as they are written; wrapattr does not close
+        # the file it wraps, so open it in its own with
+        with open(part_path, mode) as file, tqdm.wrapattr(
+            file,
+            "write",
+            desc=os.path.basename(destination),
+            total=total_size,
+            initial=existing,
+            unit='iB',
+            unit_scale=True,
+            unit_divisor=1024,
+        ) as out:
+            read = response.raw.read
+            for block in iter(lambda: read(COPY_BUFFER_SIZE), b''):
+                digest.update(block)
+                out.write(block)
+
+    os.replace(part_path, destination)
+    return digest.hexdigest()
+
+
+def _download_range(url, destination, start, end, bar, bar_lock):
+    """Download bytes start..end of url into the same offset of destination"""
+    headers = {'Range': f'bytes={start}-{end}'}
+    written = 0
+    with requests.get(url, headers=headers, stream=True) as response:
+        if response.status_code != 206:
+            raise RangeNotHonoured(f"Range request not honoured (HTTP {response.status_code})")
+        with open(destination, 'r+b') as file:
+            file.seek(start)
+            for data in response.iter_content(chunk_size=COPY_BUFFER_SIZE):
+                size = file.write(data)
+                written += size
+                with bar_lock:
+                    bar.update(size)
+
+    expected = end - start + 1
+    if written != expected:
+        raise IOError(f"Range {start}-{end} ended after {written} of {expected} bytes")
+
+
+def download_file_parallel(url, destination, parts=PARALLEL_PARTS):
+    """Download a file over several ranged connections when the server allows it"""
+    if os.path.exists(destination):
+        # Only ever created by os.replace once a download has completed
+        return
+
+    part_path = _part_path(destination)
+    if os.path.exists(part_path):
+        # A partial file from an earlier sequential run: resume it instead
+        download_file(url, destination)
+        return
+
+    head = requests.head(url, allow_redirects=True)
+    total_size = int(head.headers.get('content-length', 0))
+    accepts_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+
+    if not accepts_ranges or total_size < parts * COPY_BUFFER_SIZE:
+        download_file(url, destination)
+        return
+
+    part_size = -(-total_size // parts)  # ceiling division
+    ranges = [
+        (start, min(start + part_size, total_size) - 1)
+        for start in range(0, total_size, part_size)
+    ]
+    bar_lock = threading.Lock()
+    completed = False
+
+    try:
+        # Preallocate so each worker can write straight into its own slice
+        with open(part_path, 'wb') as file:
+            file.truncate(total_size)
+
+        with tqdm(
+            desc=os.path.basename(destination),
+            total=total_size,
+            unit='iB',
+            unit_scale=True,
+            unit_divisor=1024,
+        ) as bar, ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [
+                pool.submit(_download_range, head.url, part_path, start, end, bar, bar_lock)
+                for start, end in ranges
+            ]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        os.replace(part_path, destination)
+        completed = True
+    except RangeNotHonoured as e:
+        # Some servers/CDNs advertise ranges on HEAD but answer 200 to the GET
+        print(f"{e}; falling back to a single connection")
+    finally:
+        if not completed and os.path.exists(part_path):
+            # The preallocated file has holes, so its size says nothing about
+            # progress; drop it (also on Ctrl+C) rather than let a later run resume it
+            os.remove(part_path)
+
+    if not completed:
+        download_file(url, destination)
+
+
+def _sha256(path):
+    """Hash a file in 1 MiB blocks (hashlib uses OpenSSL's accelerated SHA-256)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for block in iter(lambda: file.read(COPY_BUFFER_SIZE), b''):
+            digest.update(block)
+    return digest
+
+
+def extract_zip(zip_path, destination):
+    """Stream each archive member to disk instead of reading it into memory"""
+    dest_root = os.path.realpath(destination)
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            target = os.path.realpath(os.path.join(dest_root, info.filename))
+            if os.path.commonpath([dest_root, target]) != dest_root:
+                raise zipfile.BadZipFile(f"Unsafe path in archive: {info.filename}")
+
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # zipfile checks each member's CRC as the stream is read to the end
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+
+
+def download_model(expected_sha256=MODEL_SHA256):
     """Download and extract the Vosk model"""
     os.makedirs(MODEL_DIR, exist_ok=True)
 
@@ -43,14 +215,32 @@ def download_model():
 
     print(f"Downloading Vosk model from {MODEL_URL}")
     try:
-        download_file(MODEL_URL, ZIP_PATH)
+        if expected_sha256:
+            # Ranged parts land out of order, so take one in-order stream and
+            # hash it on the way to disk instead of re-reading the archive
+            if os.path.exists(ZIP_PATH):
+                actual_sha256 = _sha256(ZIP_PATH).hexdigest()
+            else:
+                actual_sha256 = download_file(MODEL_URL, ZIP_PATH)
+            if actual_sha256 != expected_sha256.lower():
+                # Never keep a bad archive around for the next run to trust
+                os.remove(ZIP_PATH)
+                raise ValueError(f"Checksum mismatch: expected {expected_sha256}, got {actual_sha256}")
+        else:
+            print("Warning: no SHA-256 configured for the model archive (see --sha256); "
+                  "relying on the zip CRC checks during extraction")
+            download_file_parallel(MODEL_URL, ZIP_PATH)
+
         print("Extracting model...")
 
-        with zipfile.ZipFile(ZIP_PATH, 'r') as zip_ref:
-            bad = zip_ref.testzip()
-            if bad:
-                raise zipfile.BadZipFile(f"Corrupt file detected: {bad}")
-            zip_ref.extractall(MODEL_DIR)
+        try:
+            extract_zip(ZIP_PATH, MODEL_DIR)
+        except (zipfile.BadZipFile, EOFError):
+            # A bad CRC or truncated member: drop the half-extracted model,
+            # which would otherwise pass the MODEL_PATH check next run
+            shutil.rmtree(MODEL_PATH, ignore_errors=True)
+            os.remove(ZIP_PATH)
+            raise
 
         os.remove(ZIP_PATH)
         print(f"Model successfully downloaded and extracted to {MODEL_PATH}")
@@ -64,7 +254,8 @@ def download_model():
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Download Vosk English model")
     parser.add_argument("--url", help="Custom model URL", default=MODEL_URL)
+    parser.add_argument("--sha256", help="Expected SHA-256 of the model archive", default=MODEL_SHA256)
     args = parser.parse_args()
 
-    success = download_model()
+    success = download_model(expected_sha256=args.sha256)
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -1,10 +1,51 @@
 import sqlite3
 import logging
 import os
-from typing import List
+import stat
+import threading
+from datetime import datetime, timezone
+from typing import List, Tuple
 
 from ..security import SecurityManager
-from .models import Task
+from .models import Task, time_to_minutes
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in SQLite's datetime('now') format."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Stored in PRAGMA user_version; bump when the schema below changes
+SCHEMA_VERSION = 2
+
+SQL_CREATE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks (created_at);",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_due_minutes ON tasks (due_minutes);",
+    "CREATE INDEX IF NOT EXISTS idx_tasks_pending ON tasks (is_completed, due_minutes);",
+)
+SQL_INSERT_TASK = (
+    "INSERT INTO tasks (title_encrypted, due_time, due_minutes, created_at, is_completed) "
+    "VALUES (?, ?, ?, ?, 0);"
+)
+SQL_SELECT_ALL = (
+    "SELECT id, title_encrypted, due_time, created_at, "
+    "(is_completed != 0) AS is_completed, due_minutes "
+    "FROM tasks ORDER BY due_minutes ASC;"
+)
+SQL_SELECT_PENDING = (
+    "SELECT id, title_encrypted, due_time, created_at, 0 AS is_completed, due_minutes "
+    "FROM tasks WHERE is_completed = 0 ORDER BY due_minutes ASC;"
+)
+# Served by idx_tasks_pending (is_completed, due_minutes)
+SQL_SELECT_PENDING_AT = (
+    "SELECT id, title_encrypted, due_time, created_at, 0 AS is_completed, due_minutes "
+    "FROM tasks WHERE is_completed = 0 AND due_minutes = ?;"
+)
+SQL_DELETE = "DELETE FROM tasks WHERE id = ?;"
+SQL_DELETE_ALL = "DELETE FROM tasks;"
+SQL_MARK_DONE = "UPDATE tasks SET is_completed = 1 WHERE id = ?;"
+SQL_CLEAR_OLD = "DELETE FROM tasks WHERE created_at < ?;"
+
 
 class DatabaseManager:
     """
@@ -20,13 +61,53 @@ class DatabaseManager:
             self.db_path = db_path
         else:
             self.db_path = self.security.get_secure_db_path()
+
+        # Create a new production DB file owner read/write only, once
+        if self.db_path != ":memory:" and not os.path.exists(self.db_path):
+            os.close(os.open(
+                self.db_path, os.O_CREAT | os.O_WRONLY, stat.S_IRUSR | stat.S_IWUSR
+            ))
+
+        # Single shared connection, serialized by a lock (UI + alarm threads).
+        # sqlite3 keeps compiled statements per connection, keyed by SQL text,
+        # so the CRUD queries below are parsed once and then reused.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256
+        )
             
         self._init_db()
 
     def _init_db(self):
         """Create the 'tasks' table if it doesn't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._lock:
+                conn = self._conn
+                # user_version lives in the header page, so an up-to-date DB
+                # skips the schema script entirely on later launches
+                version = conn.execute("PRAGMA user_version;").fetchone()[0]
+                if version < SCHEMA_VERSION:
+                    self._migrate(conn, version)
+
+                # WAL + NORMAL sync: one fsync per checkpoint instead of two per write
+                if self.db_path != ":memory:":
+                    conn.execute("PRAGMA journal_mode=WAL;")
+                    conn.execute("PRAGMA synchronous=NORMAL;")
+                conn.execute("PRAGMA temp_store=MEMORY;")
+                conn.execute("PRAGMA cache_size=-8000;")
+
+        except sqlite3.Error as e:
+            logging.error(f"Database initialization error: {e}")
+            raise
+
+    def _migrate(self, conn, version: int):
+        """Bring the schema from `version` up to SCHEMA_VERSION in one transaction."""
+        conn.execute("BEGIN;")
+        try:
+            if version < 1:
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS tasks (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,94 +117,130 @@ class DatabaseManager:
                         is_completed INTEGER DEFAULT 0
                     );
                 """)
-                conn.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_tasks_due_time
-                    ON tasks (due_time);
-                """)
-                conn.commit()
-                
-                # Set secure file permissions for production DB
-                if not self.test_mode and os.path.exists(self.db_path):
-                    os.chmod(self.db_path, 0x180)  # 0o600 in octal - owner read/write only
-                    
-        except sqlite3.Error as e:
-            logging.error(f"Database initialization error: {e}")
+            if version < 2:
+                # Sort key parsed once at write time instead of on every load;
+                # NULL marks a due_time that isn't a valid time
+                conn.execute("ALTER TABLE tasks ADD COLUMN due_minutes INTEGER;")
+                # v1 indexed due_time, including an older idx_tasks_pending
+                conn.execute("DROP INDEX IF EXISTS idx_tasks_due_time;")
+                conn.execute("DROP INDEX IF EXISTS idx_tasks_pending;")
+                for statement in SQL_CREATE_INDEXES:
+                    conn.execute(statement)
+                rows = conn.execute("SELECT id, due_time FROM tasks;").fetchall()
+                conn.executemany(
+                    "UPDATE tasks SET due_minutes = ? WHERE id = ?;",
+                    [(time_to_minutes(due_time), task_id) for task_id, due_time in rows]
+                )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+            conn.execute("COMMIT;")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK;")
             raise
 
     def add_task(self, title: str, due_time: str) -> bool:
         """Add a new task with encrypted title."""
         try:
             encrypted_title = self.security.encrypt_data(title)
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    INSERT INTO tasks (title_encrypted, due_time, created_at, is_completed)
-                    VALUES (?, ?, datetime('now'), 0);
-                """, (encrypted_title, due_time))
-                conn.commit()
+            with self._lock:
+                conn = self._conn
+                conn.execute(
+                    SQL_INSERT_TASK,
+                    (encrypted_title, due_time, time_to_minutes(due_time), _utc_timestamp())
+                )
                 return True
         except sqlite3.Error as e:
             logging.error(f"Error adding task: {e}")
             return False
 
-    def get_all_tasks(self) -> List[Task]:
-        """Get all tasks with decrypted titles."""
+    def add_tasks(self, items: List[Tuple[str, str]]) -> int:
+        """
+        Add many (title, due_time) tasks in a single transaction.
+        Returns the number of tasks inserted (0 on failure).
+        """
+        if not items:
+            return 0
+        # Encrypt up front so the cipher work stays outside the transaction
+        created_at = _utc_timestamp()
+        rows = [
+            (self.security.encrypt_data(title), due_time, time_to_minutes(due_time), created_at)
+            for title, due_time in items
+        ]
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cur = conn.execute("""
-                    SELECT id, title_encrypted, due_time, created_at, is_completed
-                    FROM tasks
-                    ORDER BY due_time ASC;
-                """)
-                rows = cur.fetchall()
-                tasks = []
-                for row in rows:
-                    try:
-                        decrypted_title = self.security.decrypt_data(row["title_encrypted"])
-                        task = Task(
-                            id=row["id"],
-                            title=decrypted_title,
-                            due_time=row["due_time"],
-                            created_at=row["created_at"],
-                            is_completed=bool(row["is_completed"])
-                        )
-                        tasks.append(task)
-                    except Exception as e:
-                        logging.error(f"Error decrypting task {row['id']}: {e}")
-                        # Fallback to placeholder if decryption fails
-                        task = Task(
-                            id=row["id"],
-                            title="[Encrypted Task]",
-                            due_time=row["due_time"],
-                            created_at=row["created_at"],
-                            is_completed=bool(row["is_completed"])
-                        )
-                        tasks.append(task)
-                return tasks
+            with self._lock:
+                conn = self._conn
+                conn.execute("BEGIN;")
+                try:
+                    conn.executemany(SQL_INSERT_TASK, rows)
+                    conn.execute("COMMIT;")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK;")
+                    raise
+                return len(rows)
+        except sqlite3.Error as e:
+            logging.error(f"Error adding tasks: {e}")
+            return 0
+
+    def _query_tasks(self, sql: str, params: tuple = ()) -> List[Task]:
+        """
+        Run a task SELECT and build decrypted Task objects straight from the
+        cursor, so the rows are never held in a second list.
+        """
+        decrypt = self.security.decrypt_data
+        try:
+            with self._lock:
+                # SQLite already normalized is_completed to 0/1
+                return [
+                    Task(
+                        task_id, decrypt(title_encrypted), due_time, created_at,
+                        is_completed == 1, due_minutes
+                    )
+                    for task_id, title_encrypted, due_time, created_at, is_completed, due_minutes
+                    in self._conn.execute(sql, params)
+                ]
         except sqlite3.Error as e:
             logging.error(f"Error fetching tasks: {e}")
             return []
 
+    def get_all_tasks(self) -> List[Task]:
+        """Get all tasks with decrypted titles, ordered by due time."""
+        return self._query_tasks(SQL_SELECT_ALL)
+
+    def get_pending_tasks(self) -> List[Task]:
+        """Get non-completed tasks with decrypted titles, ordered by due time."""
+        return self._query_tasks(SQL_SELECT_PENDING)
+
+    def get_pending_tasks_at(self, minute_of_day: int) -> List[Task]:
+        """Get non-completed tasks due at `minute_of_day` (minutes since midnight)."""
+        return self._query_tasks(SQL_SELECT_PENDING_AT, (minute_of_day,))
+
     def delete_task(self, task_id: int) -> bool:
         """Delete a task by ID."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cur = conn.execute("DELETE FROM tasks WHERE id = ?;", (task_id,))
-                conn.commit()
+            with self._lock:
+                conn = self._conn
+                cur = conn.execute(SQL_DELETE, (task_id,))
                 return cur.rowcount > 0
         except sqlite3.Error as e:
             logging.error(f"Error deleting task: {e}")
             return False
 
+    def delete_all_tasks(self) -> int:
+        """Delete every task in one statement. Returns the number removed (0 on failure)."""
+        try:
+            with self._lock:
+                conn = self._conn
+                cur = conn.execute(SQL_DELETE_ALL)
+                return cur.rowcount
+        except sqlite3.Error as e:
+            logging.error(f"Error deleting all tasks: {e}")
+            return 0
+
     def mark_done(self, task_id: int) -> bool:
         """Mark a task as completed."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cur = conn.execute(
-                    "UPDATE tasks SET is_completed = 1 WHERE id = ?;",
-                    (task_id,)
-                )
-                conn.commit()
+            with self._lock:
+                conn = self._conn
+                cur = conn.execute(SQL_MARK_DONE, (task_id,))
                 return cur.rowcount > 0
         except sqlite3.Error as e:
             logging.error(f"Error completing task: {e}")
@@ -132,13 +249,23 @@ class DatabaseManager:
     def clear_old_tasks(self) -> bool:
         """Remove tasks from previous calendar days."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("""
-                    DELETE FROM tasks
-                    WHERE DATE(created_at) < DATE('now')
-                """)
-                conn.commit()
+            with self._lock:
+                conn = self._conn
+                # Plain range compare on the ISO text keeps idx_tasks_created_at usable
+                today = datetime.now(timezone.utc).date().isoformat()
+                conn.execute(SQL_CLEAR_OLD, (today,))
             return True
         except sqlite3.Error as e:
             logging.error(f"Error clearing old tasks: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error as e:
+                    logging.error(f"Error closing database: {e}")
+                finally:
+                    self._conn = None
@@ -1,11 +1,47 @@
+import re
+import sys
+from functools import lru_cache
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+# slots=True needs Python 3.10+; on 3.9 Task stays a regular dataclass
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# '6:35PM', '6PM', '18:35', '18' once spaces are stripped and upper-cased
+_TIME_RE = re.compile(r'^(\d{1,2})(?::(\d{1,2}))?(AM|PM)?$')
+_MERIDIEM_OFFSET = {'AM': 0, 'PM': 12}
+
+
+# Due times repeat across tasks and alarm ticks, so memoize on the raw string
+@lru_cache(maxsize=512)
+def time_to_minutes(time_str) -> Optional[int]:
+    """
+    Minutes since midnight for '3:00 PM' / '3 PM' / '15:00' style strings.
+    Returns None when the string isn't a valid time (e.g. '13 PM', '25:00').
+    """
+    match = _TIME_RE.match(str(time_str or '').upper().replace(' ', ''))
+    if not match:
+        return None
+    hours, minutes, period = int(match.group(1)), int(match.group(2) or 0), match.group(3)
+    if period:
+        if not 1 <= hours <= 12:
+            return None
+        # 12 AM -> 0, 12 PM -> 12, 1-11 PM -> 13-23
+        hours = hours % 12 + _MERIDIEM_OFFSET[period]
+    elif hours > 23:
+        return None
+    if minutes > 59:
+        return None
+    return hours * 60 + minutes
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Task:
     id: int
     title: str
     due_time: str  # Store as string for simplicity
     created_at: str
-    is_completed: bool = False
\ No newline at end of file
+    is_completed: bool = False
+    # Minutes since midnight, parsed once at insert time (tasks.due_minutes)
+    due_minutes: Optional[int] = None
\ No newline at end of file
@@ -5,7 +5,20 @@ GUI components for the Voice Assistant MVP
 from .main_screen import MainScreen, TaskItem
 from .tasks_screen import TasksScreen
 from .settings_screen import SettingsScreen
-from .popups import ConfirmationPopup, ListeningPopup, AddTaskPopup, SettingsConfirmationPopup, AlarmPopup
+
+# Popups are resolved on first access so importing a screen doesn't pull them in
+_POPUP_NAMES = frozenset((
+    'ConfirmationPopup', 'ListeningPopup', 'AddTaskPopup',
+    'SettingsConfirmationPopup', 'AlarmPopup',
+))
+
+
+def __getattr__(name):
+    if name in _POPUP_NAMES:
+        from . import popups
+        return getattr(popups, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'MainScreen',
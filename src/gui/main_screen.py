@@ -1,45 +1,137 @@
 import logging
+import math
+import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.properties import ListProperty, StringProperty, NumericProperty, BooleanProperty
+from kivy.properties import ListProperty, StringProperty, NumericProperty, BooleanProperty, ObjectProperty
 from kivy.clock import Clock
 from kivy.metrics import dp
-from kivy.animation import Animation
 
-from .popups import AddTaskPopup, ConfirmationPopup, ListeningPopup
 
 logger = logging.getLogger(__name__)
 
+# Plain substring alternation, same matching as the old `word in text` checks
+_SUGGEST_RE = re.compile(
+    r'(?P<delete>delete|remove|cancel)'
+    r'|(?P<done>done|finished|completed)'
+    r'|(?P<show>show|list|what|tell)'
+    r'|(?P<time>time|when|schedule)',
+    re.IGNORECASE
+)
+
+_SUGG_DELETE = "• 'Delete my appointment'\n• 'Remove the task'\n• 'Cancel walking task'"
+_SUGG_DONE = "• 'Done with medicine'\n• 'Finished walking'\n• 'Mark task as done'"
+_SUGG_SHOW = "• 'Show my tasks'\n• 'What do I have today?'\n• 'List all tasks'"
+_SUGG_TIME = "• 'What time is my appointment?'\n• 'When do I take medicine?'"
+_SUGG_DEFAULT = "• 'Remind me to walk at 3 PM'\n• 'Delete my meeting'\n• 'Mark medicine as done'\n• 'Show my tasks'"
+
+_SUGGESTION_ORDER = ('delete', 'done', 'show', 'time')
+_SUGGESTIONS = {
+    'delete': _SUGG_DELETE,
+    'done': _SUGG_DONE,
+    'show': _SUGG_SHOW,
+    'time': _SUGG_TIME,
+}
+
+
+# Speak button pulse: one grow/shrink cycle, stepped at a low fixed rate
+_SPEAK_PULSE_PERIOD = 3.0
+_SPEAK_PULSE_FPS = 12
+
+
+@lru_cache(maxsize=1)
+def _make_speak_pulse(grown_px, rest_px):
+    """
+    Pre-baked button sizes for one pulse cycle. Stepping through these on a
+    12 Hz interval wakes the Clock far less than a per-frame Animation.
+    """
+    steps = int(_SPEAK_PULSE_PERIOD * _SPEAK_PULSE_FPS)
+    delta = grown_px - rest_px
+    return tuple(
+        rest_px + delta * (1 - math.cos(2 * math.pi * i / steps)) / 2
+        for i in range(steps)
+    )
+
 
 class MainScreen(Screen):
     tasks = ListProperty([])
     font_size = NumericProperty()
+    # dp(font_size), converted once here and shared by the KV and task rows
+    scaled_font_size = NumericProperty()
     font_family = StringProperty()
     high_contrast = BooleanProperty(False)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.app = None
+        # Services resolved once in set_app_instance; None when unavailable
+        self._db = None
+        self._tts = None
+        self._stt = None
         self.listening_popup = None
         self.pending_task = None
+        # Clock event driving the speak button pulse while the screen is shown
         self.speak_animation = None
+        self._speak_pulse_sizes = ()
+        self._speak_pulse_index = 0
+        self._tasks_cache = None
+        self._title_index = None
+        # Bumped whenever the task list changes; results of older loads are dropped
+        self._tasks_seq = 0
+        # app.tasks_version this screen's list reflects
+        self.tasks_version_seen = 0
+        # Styled widgets, collected lazily and dropped when the task rows change
+        self._font_targets = None
+        self._display_sig = None
+        self._refresh_trigger = Clock.create_trigger(self._do_load_tasks, 0)
+        # One worker keeps SQLite access serialized off the UI thread
+        self._db_executor = ThreadPoolExecutor(max_workers=1)
         Clock.schedule_once(self._post_init, 0.1)
 
     def set_app_instance(self, app_instance):
         self.app = app_instance
+        self._db = getattr(app_instance, "db_manager", None)
+        self._tts = getattr(app_instance, "tts_engine", None)
+        self._stt = getattr(app_instance, "stt_engine", None)
         if self.app:
             self.font_family = self.app.font_family
             self.font_size = self.app.font_size
             self.high_contrast = self.app.high_contrast
 
+    def on_font_size(self, instance, value):
+        self.scaled_font_size = dp(value)
+
     def _post_init(self, dt):
+        # ids exist by now; task rows style themselves from their data,
+        # so one callback can do all the deferred setup in order
         if self.app:
             self.load_tasks()
-        # Apply fonts to all children once widgets exist
-        Clock.schedule_once(lambda _dt: self._apply_font_to_children(), 0.2)
-        Clock.schedule_once(lambda dt: self.animate_speak_button(), 0.5)
+        self._apply_font_to_children()
+        self.animate_speak_button()
+
+    def _collect_font_targets(self):
+        """
+        Walk the tree once and remember (weakref, gets_name, gets_size) for
+        every widget _apply_font_to_children styles.
+        """
+        targets = []
+        for child in self.walk():
+            gets_name = hasattr(child, 'font_name')
+            # Font size skips Button text and labels that are direct children of Buttons
+            gets_size = (
+                hasattr(child, 'font_size')
+                and hasattr(child, 'text')
+                and not isinstance(child, Button)
+                and not isinstance(getattr(child, 'parent', None), Button)
+            )
+            if gets_name or gets_size:
+                targets.append((weakref.ref(child), gets_name, gets_size))
+        self._font_targets = targets
 
     def _apply_font_to_children(self):
         """
@@ -52,69 +144,164 @@ class MainScreen(Screen):
         if not hasattr(self, 'walk'):
             return
 
-        for child in self.walk():
-            # Apply font family everywhere that supports it
-            if hasattr(child, 'font_name') and self.font_family:
-                child.font_name = self.font_family
+        if self._font_targets is None:
+            self._collect_font_targets()
 
-            # Apply font size only to non-button text widgets and
-            # not to labels that are direct children of Buttons
-            if (
-                hasattr(child, 'font_size')
-                and hasattr(child, 'text')
-                and not isinstance(child, Button)
-                and not isinstance(getattr(child, 'parent', None), Button)
-            ):
-                child.font_size = dp(self.font_size)
+        font_family = self.font_family
+        font_px = self.scaled_font_size
+        for ref, gets_name, gets_size in self._font_targets:
+            child = ref()
+            if child is None:
+                continue
+            # Apply font family everywhere that supports it
+            if gets_name and font_family:
+                child.font_name = font_family
+            if gets_size:
+                child.font_size = font_px
 
     def animate_speak_button(self):
+        if self.speak_animation is not None:
+            return
         if not hasattr(self, 'ids') or 'speak_button' not in self.ids:
             return
 
-        speak_button = self.ids.speak_button
-        if self.speak_animation:
-            self.speak_animation.cancel(speak_button)
+        # Reused across restarts; only rebuilt if the pixel sizes change
+        self._speak_pulse_sizes = _make_speak_pulse(dp(160), dp(140))
+        self._speak_pulse_index = 0
+        self.speak_animation = Clock.schedule_interval(
+            self._step_speak_pulse, 1.0 / _SPEAK_PULSE_FPS
+        )
+
+    def _step_speak_pulse(self, dt):
+        sizes = self._speak_pulse_sizes
+        px = sizes[self._speak_pulse_index]
+        self.ids.speak_button.size = (px, px)
+        self._speak_pulse_index = (self._speak_pulse_index + 1) % len(sizes)
+
+    def stop_speak_animation(self):
+        if self.speak_animation is None:
+            return
+        self.speak_animation.cancel()
+        self.speak_animation = None
+        if 'speak_button' in self.ids and self._speak_pulse_sizes:
+            rest_px = self._speak_pulse_sizes[0]
+            self.ids.speak_button.size = (rest_px, rest_px)
+
+    def on_enter(self, *args):
+        self.refresh_tasks_if_dirty()
+        self.animate_speak_button()
+
+    def on_leave(self, *args):
+        # No per-frame animation work while the screen isn't visible
+        self.stop_speak_animation()
+
+    def _run_db(self, func, *args, on_done=None, on_error=None):
+        """
+        Run a blocking DB call on the worker thread and hand its result
+        (or exception) to on_done/on_error back on the Kivy thread.
+        """
+        def deliver(future):
+            error = future.exception()
+            if error is not None:
+                if on_error:
+                    Clock.schedule_once(lambda dt: on_error(error))
+                else:
+                    logging.error(f"Database call failed: {error}")
+            elif on_done:
+                result = future.result()
+                Clock.schedule_once(lambda dt: on_done(result))
+
+        self._db_executor.submit(func, *args).add_done_callback(deliver)
+
+    def shutdown(self):
+        """Let queued DB work finish; call before the DB connection closes."""
+        self._db_executor.shutdown(wait=True)
 
-        self.speak_animation = (
-            Animation(size=(dp(160), dp(160)), duration=1.5, t='out_elastic') +
-            Animation(size=(dp(140), dp(140)), duration=1.5, t='out_elastic')
+    def _with_pending_tasks(self, callback):
+        """
+        Call `callback(tasks)` with the pending tasks, reusing the last fetch
+        until a mutation invalidates it; otherwise fetch on the DB worker.
+        """
+        if self._tasks_cache is not None:
+            callback(self._tasks_cache)
+            return
+        seq = self._tasks_seq
+        self._run_db(
+            self._db.get_pending_tasks,
+            on_done=lambda tasks: self._on_pending_fetched(tasks, seq, callback),
+            on_error=lambda e: logging.error(f"Error loading tasks: {e}")
         )
-        self.speak_animation.repeat = True
-        self.speak_animation.start(speak_button)
 
-    def load_tasks(self):
-        """Load tasks from DB and only show non-completed ones on the main screen."""
+    def _on_pending_fetched(self, tasks, seq, callback):
+        if seq != self._tasks_seq:
+            # The list changed while this query was in flight; use the newer one
+            self._with_pending_tasks(callback)
+            return
+        self._tasks_cache = tasks
+        self._title_index = None
+        callback(tasks)
+
+    def _iter_active_task_titles(self):
+        """
+        Yield (id, lower_title, task) for the cached pending tasks. Titles are
+        lowered once per cache fill rather than on every voice lookup.
+        """
+        if self._title_index is None:
+            self._title_index = [
+                (t.id, t.title.lower(), t) for t in self._tasks_cache or ()
+            ]
+        return iter(self._title_index)
+
+    def _find_pending_tasks(self, substring):
+        """
+        Pending tasks whose title contains `substring` (case-insensitive).
+        Titles are encrypted at rest, so SQL LIKE can't see them; match
+        against the decrypted cache instead of re-reading the table.
+        """
+        needle = substring.lower()
+        return [task for _, title, task in self._iter_active_task_titles() if needle in title]
+
+    def _invalidate_tasks_cache(self):
+        self._tasks_cache = None
+        self._title_index = None
+        self._tasks_seq += 1
+
+    def load_tasks(self, tasks=None):
+        """
+        Load non-completed tasks from DB (already ordered by due time).
+        Pass a pending task list as `tasks` to refresh without querying again.
+        """
+        if not self.app:
+            return
+        self._invalidate_tasks_cache()
+        if tasks is None:
+            # Other screens call this after their own writes, so refetch;
+            # back-to-back requests within a frame collapse into one query
+            self._refresh_trigger()
+        else:
+            self._tasks_cache = tasks
+            self._show_tasks(tasks)
+
+    def refresh_tasks_if_dirty(self):
+        """Reload tasks only if they changed since this screen last showed them."""
+        app = self.app
+        if not app or self.tasks_version_seen == app.tasks_version:
+            return
+        self.tasks_version_seen = app.tasks_version
+        self.load_tasks()
+
+    def _do_load_tasks(self, dt=None):
         if not self.app:
             return
+        self._with_pending_tasks(self._show_tasks)
+
+    def _show_tasks(self, tasks):
         try:
-            tasks = self.app.db_manager.get_all_tasks()
-            # Filter out completed tasks for display
-            tasks = [t for t in tasks if not t.is_completed]
-            self.tasks = self.sort_tasks_by_time(tasks)
+            self.tasks = tasks
             self.update_tasks_display()
         except Exception as e:
             logging.error(f"Error loading tasks: {e}")
 
-    def sort_tasks_by_time(self, tasks):
-        def time_to_minutes(time_str):
-            try:
-                time_str = time_str.upper().replace(' ', '')
-                if 'AM' in time_str or 'PM' in time_str:
-                    time_part = time_str.replace('AM', '').replace('PM', '')
-                    hours, minutes = map(int, time_part.split(':'))
-                    if 'PM' in time_str and hours != 12:
-                        hours += 12
-                    if 'AM' in time_str and hours == 12:
-                        hours = 0
-                    return hours * 60 + minutes
-                else:
-                    hours, minutes = map(int, time_str.split(':'))
-                    return hours * 60 + minutes
-            except Exception:
-                return 0
-
-        return sorted(tasks, key=lambda x: time_to_minutes(x.due_time))
-
     def show_settings(self):
         if self.app:
             self.app.show_settings_screen()
@@ -123,74 +310,79 @@ class MainScreen(Screen):
         """
         Called by app when settings change globally.
         """
+        if (font_family, font_size, high_contrast) == (
+            self.font_family, self.font_size, self.high_contrast
+        ):
+            return
         print(f"🔧 MainScreen: Applying settings - {font_family} {font_size}px, Contrast: {high_contrast}")
         self.font_family = font_family
         self.font_size = font_size
         self.high_contrast = high_contrast
         self._apply_font_to_children()
-        self.load_tasks()
+        # Only fonts changed: rows restyle from their data, no DB round-trip
+        self.update_tasks_display()
 
     def refresh_with_settings(self, font_family, font_size, high_contrast):
         self.apply_settings(font_family, font_size, high_contrast)
 
     def update_tasks_display(self):
-        if not hasattr(self, 'ids') or 'tasks_grid' not in self.ids:
+        if not hasattr(self, 'ids') or 'tasks_rv' not in self.ids:
             return
 
-        self.ids.tasks_grid.clear_widgets()
-
-        if not self.tasks:
-            empty_label = Label(
-                text="No tasks yet\nPress the Microphone or 'Add Task' to create one",
-                font_size=dp(self.font_size),
-                font_name=self.font_family,
-                color=(0.5, 0.5, 0.5, 1),
-                size_hint_y=None,
-                height=dp(100),
-                text_size=(None, None),
-                halign='center'
-            )
-            self.ids.tasks_grid.add_widget(empty_label)
+        # Show only first 3 tasks on main screen; the empty state lives in KV.
+        # The signature rows double as the source for the row data below
+        rows = tuple(
+            (t.id, t.title, t.due_time, t.is_completed) for t in islice(self.tasks, 3)
+        )
+        signature = (self.font_family, self.font_size, rows)
+        if signature == self._display_sig:
+            # Nothing visible changed; skip the rebind and layout pass
             return
-
-        # Show only first 3 tasks on main screen
-        for task in self.tasks[:3]:
-            task_item = TaskItem(
-                text=f"{task.title}\nAt: {task.due_time}",
-                task_id=task.id,
-                font_family=self.font_family,
-                font_size=self.font_size
-            )
-            task_item.bind(on_delete=self.delete_task)
-            task_item.bind(on_complete=self.mark_done)
-            self.ids.tasks_grid.add_widget(task_item)
+        self._display_sig = signature
+
+        self.ids.tasks_rv.data = [
+            {
+                'text': f"{title}\nAt: {due_time}",
+                'task_id': task_id,
+                'font_family': self.font_family,
+                'font_size': self.scaled_font_size,
+                'owner': self,
+            }
+            for task_id, title, due_time, _ in rows
+        ]
+        # RecycleView may add row widgets for the new data
+        self._font_targets = None
 
     # ---------- VISUAL mark as done ----------
     def mark_done(self, instance, task_id):
         """Mark a task as done from the main-screen button."""
         if not self.app:
             return
-        try:
-            if self.app.db_manager.mark_done(task_id):
-                self.load_tasks()
+        self._run_db(
+            self._db.mark_done, task_id,
+            on_done=self._on_task_marked_done,
+            on_error=self._on_task_mark_error
+        )
 
-                # Keep TasksScreen in sync
-                try:
-                    tasks_screen = self.app.screen_manager.get_screen('tasks')
-                    if hasattr(tasks_screen, 'load_all_tasks'):
-                        tasks_screen.load_all_tasks()
-                except Exception:
-                    pass
+    def _on_task_marked_done(self, success):
+        tts = self._tts
+        if success:
+            self.load_tasks()
 
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak("Task Done")
-            else:
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak("Error completing task")
-        except Exception as e:
-            logging.error(f"Error completing task: {e}")
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("Could not complete task")
+            # TasksScreen reloads on its next on_enter
+            self.app.mark_tasks_dirty(source=self)
+
+            if tts:
+                tts.speak("Task Done")
+        else:
+            if tts:
+                tts.speak("Error completing task")
+
+    def _on_task_mark_error(self, e):
+        tts = self._tts
+        logging.error(f"Error completing task: {e}")
+        if tts:
+            tts.speak("Could not complete task")
 
     # ---------- Voice flow ----------
     def start_voice_command(self):
@@ -203,22 +395,26 @@ class MainScreen(Screen):
         if not self.app:
             return
 
-        if getattr(self.app, "tts_engine", None):
-            self.app.tts_engine.stop()
+        tts = self._tts
+        if tts:
+            tts.stop()
 
+        # Popups load on first use, keeping them off the startup import path
+        from .popups import ListeningPopup
         self.listening_popup = ListeningPopup(dismiss_callback=self.cancel_listening)
         self.listening_popup.open()
-        self.app.stt_engine.start_listening(self.on_voice_command)
+        self._stt.start_listening(self.on_voice_command)
 
     def cancel_listening(self):
-        if self.app and self.app.stt_engine:
-            self.app.stt_engine.stop_listening()
+        if self._stt:
+            self._stt.stop_listening()
         self.listening_popup = None
 
     def on_voice_command(self, text):
         Clock.schedule_once(lambda dt: self._process_voice_command(text), 0)
 
     def _process_voice_command(self, text):
+        tts = self._tts
         if self.listening_popup:
             self.listening_popup.dismiss()
             self.listening_popup = None
@@ -242,8 +438,8 @@ class MainScreen(Screen):
 
             elif command_type == "MARK_DONE":
                 self.handle_mark_done(result["task"])
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak(f"Marked {result['task']} as done")
+                if tts:
+                    tts.speak(f"Marked {result['task']} as done")
 
             elif command_type == "DELETE_TASK":
                 task_to_delete = result["task"]
@@ -257,6 +453,7 @@ class MainScreen(Screen):
                 logging.error(f"Unknown command type: {command_type}")
 
         else:
+            from .popups import ConfirmationPopup
             suggestions = self.get_smart_suggestions(text)
             error_popup = ConfirmationPopup(
                 confirmation_text=f"I didn't understand: '{text}'\n\nTry:\n{suggestions}"
@@ -264,79 +461,88 @@ class MainScreen(Screen):
             error_popup.title = 'Need Help?'
             error_popup.open()
 
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("Here are some examples you can try")
+            if tts:
+                tts.speak("Here are some examples you can try")
 
     def get_smart_suggestions(self, user_text):
-        user_text_lower = user_text.lower()
-
-        if any(word in user_text_lower for word in ['delete', 'remove', 'cancel']):
-            return "• 'Delete my appointment'\n• 'Remove the task'\n• 'Cancel walking task'"
-
-        elif any(word in user_text_lower for word in ['done', 'finished', 'completed']):
-            return "• 'Done with medicine'\n• 'Finished walking'\n• 'Mark task as done'"
-
-        elif any(word in user_text_lower for word in ['show', 'list', 'what', 'tell']):
-            return "• 'Show my tasks'\n• 'What do I have today?'\n• 'List all tasks'"
-
-        elif any(word in user_text_lower for word in ['time', 'when', 'schedule']):
-            return "• 'What time is my appointment?'\n• 'When do I take medicine?'"
-
-        else:
-            return "• 'Remind me to walk at 3 PM'\n• 'Delete my meeting'\n• 'Mark medicine as done'\n• 'Show my tasks'"
+        # One scan collects every keyword bucket present; the first bucket in
+        # _SUGGESTION_ORDER wins, matching the old if/elif priority
+        found = set()
+        for match in _SUGGEST_RE.finditer(user_text):
+            if match.lastgroup == _SUGGESTION_ORDER[0]:
+                # Nothing outranks the top bucket, so stop scanning
+                return _SUGGESTIONS[match.lastgroup]
+            found.add(match.lastgroup)
+        for bucket in _SUGGESTION_ORDER:
+            if bucket in found:
+                return _SUGGESTIONS[bucket]
+        return _SUGG_DEFAULT
 
     def _handle_list_tasks_command(self):
         if not self.app:
             return
 
-        tasks = self.app.db_manager.get_all_tasks()
-        tasks = [t for t in tasks if not t.is_completed]
+        if not self._tts:
+            # Nothing to say it with, so don't build the text at all
+            return
+
+        self._with_pending_tasks(self._speak_task_list)
 
+    def _speak_task_list(self, tasks):
+        tts = self._tts
         if not tasks:
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("You have no tasks.")
+            tts.speak("You have no tasks.")
             return
 
-        task_text = "Here are your tasks: "
-        for i, task in enumerate(tasks, 1):
-            task_text += f"Task {i}: {task.title} at {task.due_time}. "
-
-        if getattr(self.app, "tts_engine", None):
-            self.app.tts_engine.speak(task_text)
+        parts = ["Here are your tasks: "]
+        parts.extend(
+            f"Task {i}: {task.title} at {task.due_time}. "
+            for i, task in enumerate(tasks, 1)
+        )
+        tts.speak(''.join(parts))
 
     def handle_delete_task_command(self, task_to_delete):
         if not self.app:
             return
+        self._with_pending_tasks(lambda tasks: self._delete_first_match(task_to_delete))
 
-        tasks = self.app.db_manager.get_all_tasks()
-        found_task = None
+    def _delete_first_match(self, task_to_delete):
+        tts = self._tts
 
-        task_to_delete_lower = task_to_delete.lower()
-        for task in tasks:
-            if task_to_delete_lower in task.title.lower():
-                found_task = task
-                break
+        # Only the first match is deleted, so stop scanning once it's found
+        needle = task_to_delete.lower()
+        found_task = next(
+            (task for _, title, task in self._iter_active_task_titles() if needle in title),
+            None
+        )
 
         if found_task:
-            if self.app.db_manager.delete_task(found_task.id):
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak(f"Deleted task: {found_task.title}")
+            self._run_db(
+                self._db.delete_task, found_task.id,
+                on_done=lambda success: self._on_voice_task_deleted(success, found_task),
+                on_error=self._on_task_delete_error
+            )
+        else:
+            if tts:
+                tts.speak(f"Could not find task: {task_to_delete}")
+
+    def _on_voice_task_deleted(self, success, found_task):
+        tts = self._tts
+        if success:
+            if tts:
+                tts.speak(f"Deleted task: {found_task.title}")
+            # Refresh from the list we already hold instead of re-querying
+            cached = self._tasks_cache
+            if cached is not None:
+                self.load_tasks(tasks=[t for t in cached if t.id != found_task.id])
+            else:
                 self.load_tasks()
 
-                # Keep TasksScreen in sync
-                try:
-                    tasks_screen = self.app.screen_manager.get_screen('tasks')
-                    if hasattr(tasks_screen, 'load_all_tasks'):
-                        tasks_screen.load_all_tasks()
-                except Exception:
-                    pass
-
-            else:
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak("Error deleting task")
+            # TasksScreen reloads on its next on_enter
+            self.app.mark_tasks_dirty(source=self)
         else:
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak(f"Could not find task: {task_to_delete}")
+            if tts:
+                tts.speak("Error deleting task")
 
     # ---------- Voice mark as done ----------
     def handle_mark_done(self, task_description):
@@ -347,32 +553,44 @@ class MainScreen(Screen):
 
         if not self.app:
             return
+        self._with_pending_tasks(lambda tasks: self._mark_matches_done(task_description))
 
-        all_tasks = self.app.db_manager.get_all_tasks()
-        tasks_marked = []
+    def _mark_matches_done(self, task_description):
+        matches = self._find_pending_tasks(task_description)
+        mark_done = self._db.mark_done
 
-        for task in all_tasks:
-            if task_description.lower() in task.title.lower():
-                if self.app.db_manager.mark_done(task.id):
-                    tasks_marked.append(task.title)
-                    logging.info(f"Marked as done: {task.title}")
+        def mark_all():
+            # Runs on the DB worker; returns the tasks that were updated
+            return [task for task in matches if mark_done(task.id)]
 
-        self.load_tasks()
+        self._run_db(
+            mark_all,
+            on_done=self._on_voice_tasks_marked,
+            on_error=self._on_task_mark_error
+        )
 
-        # Keep TasksScreen in sync
-        try:
-            tasks_screen = self.app.screen_manager.get_screen('tasks')
-            if hasattr(tasks_screen, 'load_all_tasks'):
-                tasks_screen.load_all_tasks()
-        except Exception:
-            pass
-
-        if tasks_marked:
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak(f"Marked {len(tasks_marked)} tasks as done")
+    def _on_voice_tasks_marked(self, marked):
+        tts = self._tts
+        for task in marked:
+            logging.info(f"Marked as done: {task.title}")
+
+        # Drop what we just completed instead of re-querying
+        cached = self._tasks_cache
+        if cached is not None:
+            marked_ids = {task.id for task in marked}
+            self.load_tasks(tasks=[t for t in cached if t.id not in marked_ids])
         else:
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("No matching tasks found to mark as done")
+            self.load_tasks()
+
+        # TasksScreen reloads on its next on_enter
+        self.app.mark_tasks_dirty(source=self)
+
+        if marked:
+            if tts:
+                tts.speak(f"Marked {len(marked)} tasks as done")
+        else:
+            if tts:
+                tts.speak("No matching tasks found to mark as done")
 
     def create_task(self, task, time, original_text=""):
         if self.app and hasattr(self.app, 'command_parser'):
@@ -381,57 +599,72 @@ class MainScreen(Screen):
         # Rest of your existing method continues unchanged:
         if not self.app:
             return
-        try:
-            if self.app.db_manager.add_task(task, time):
-                confirmation_text = f"Task added!\n\n{task}\nAt: {time}"
-                confirmation_popup = ConfirmationPopup(confirmation_text=confirmation_text)
-                confirmation_popup.open()
+        self._run_db(
+            self._db.add_task, task, time,
+            on_done=lambda success: self._on_task_created(success, task, time),
+            on_error=self._on_task_create_error
+        )
 
-                speak_text = f"Task added: {task} at {time}"
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak(speak_text)
+    def _on_task_created(self, success, task, time):
+        from .popups import ConfirmationPopup
+        tts = self._tts
+        if success:
+            confirmation_text = f"Task added!\n\n{task}\nAt: {time}"
+            confirmation_popup = ConfirmationPopup(confirmation_text=confirmation_text)
+            confirmation_popup.open()
 
-                self.load_tasks()
-                logging.info(f"Task created: {task} at {time}")
-            else:
-                error_popup = ConfirmationPopup(confirmation_text="Could not save task. Please try again.")
-                error_popup.title = 'Error'
-                error_popup.open()
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak("Error saving task")
+            speak_text = f"Task added: {task} at {time}"
+            if tts:
+                tts.speak(speak_text)
 
-        except Exception as e:
-            logging.error(f"Error creating task: {e}")
-            error_popup = ConfirmationPopup(confirmation_text="There was an error creating your task.")
+            self.load_tasks()
+            self.app.mark_tasks_dirty(source=self)
+            logging.info(f"Task created: {task} at {time}")
+        else:
+            error_popup = ConfirmationPopup(confirmation_text="Could not save task. Please try again.")
             error_popup.title = 'Error'
             error_popup.open()
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("Error creating task")
+            if tts:
+                tts.speak("Error saving task")
+
+    def _on_task_create_error(self, e):
+        from .popups import ConfirmationPopup
+        tts = self._tts
+        logging.error(f"Error creating task: {e}")
+        error_popup = ConfirmationPopup(confirmation_text="There was an error creating your task.")
+        error_popup.title = 'Error'
+        error_popup.open()
+        if tts:
+            tts.speak("Error creating task")
 
     def delete_task(self, instance, task_id):
         if not self.app:
             return
-        try:
-            if self.app.db_manager.delete_task(task_id):
-                self.load_tasks()
+        self._run_db(
+            self._db.delete_task, task_id,
+            on_done=self._on_task_deleted,
+            on_error=self._on_task_delete_error
+        )
 
-                # Keep TasksScreen in sync
-                try:
-                    tasks_screen = self.app.screen_manager.get_screen('tasks')
-                    if hasattr(tasks_screen, 'load_all_tasks'):
-                        tasks_screen.load_all_tasks()
-                except Exception:
-                    pass
+    def _on_task_deleted(self, success):
+        tts = self._tts
+        if success:
+            self.load_tasks()
 
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak("Task deleted")
-            else:
-                if getattr(self.app, "tts_engine", None):
-                    self.app.tts_engine.speak("Error deleting task")
-        except Exception as e:
-            logging.error(f"Error deleting task: {e}")
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("Could not delete task")
+            # TasksScreen reloads on its next on_enter
+            self.app.mark_tasks_dirty(source=self)
+
+            if tts:
+                tts.speak("Task deleted")
+        else:
+            if tts:
+                tts.speak("Error deleting task")
+
+    def _on_task_delete_error(self, e):
+        tts = self._tts
+        logging.error(f"Error deleting task: {e}")
+        if tts:
+            tts.speak("Could not delete task")
 
     def show_all_tasks(self):
         if self.app:
@@ -441,6 +674,7 @@ class MainScreen(Screen):
         if not self.app:
             return
 
+        from .popups import AddTaskPopup
         add_task_popup = AddTaskPopup(save_callback=self._handle_manual_task_save)
         add_task_popup.app = self.app
         add_task_popup.open()
@@ -453,23 +687,24 @@ class MainScreen(Screen):
         self.create_task(formatted_task, time_text)
 
 class TaskItem(BoxLayout):
+    """RecycleView row; forwards its button events to the owning MainScreen."""
     __events__ = ('on_delete', 'on_complete')
     text = StringProperty("")
     task_id = NumericProperty(0)
     font_family = StringProperty()
     font_size = NumericProperty()
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    owner = ObjectProperty(None, allownone=True)
 
     def delete_task(self):
         self.dispatch('on_delete', self.task_id)
 
-    def on_delete(self, *args):
-        pass
+    def on_delete(self, task_id):
+        if self.owner:
+            self.owner.delete_task(self, task_id)
 
     def mark_done(self):
         self.dispatch('on_complete', self.task_id)
 
-    def on_complete(self, *args):
-        pass
+    def on_complete(self, task_id):
+        if self.owner:
+            self.owner.mark_done(self, task_id)
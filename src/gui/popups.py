@@ -1,5 +1,6 @@
 import re
 import logging
+from kivy.app import App
 from kivy.uix.popup import Popup
 from kivy.metrics import dp
 from kivy.properties import StringProperty, NumericProperty, ObjectProperty
@@ -7,43 +8,70 @@ from kivy.uix.button import Button
 
 logger = logging.getLogger(__name__)
 
+# 24-hour HH:MM, compiled once for every popup instance
+_TIME_RE = re.compile(r'^([0-1]?[0-9]|2[0-3]):([0-5][0-9])$')
+
 
 class BasePopup(Popup):
     """
     Base class for popups with common font behaviour.
 
-    - font_family and font_size come from app defaults.
-    - on_open applies font family everywhere and font size to non-button text.
+    - font_family and font_size follow the app's settings while open.
+    - fonts apply family everywhere and size to non-button text.
     """
     font_family = StringProperty('Rubik')
     font_size = NumericProperty(18)
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._app = App.get_running_app()
+        # (widget, gets_name, gets_size), collected on first open
+        self._font_targets = None
+
     def on_open(self):
         """
         Apply global fonts to popup contents when opened.
         """
-        try:
-            from kivy.app import App
-
-            app = App.get_running_app()
-            if app:
-                self.font_family = getattr(app, "font_family", "Rubik")
-                self.font_size = getattr(app, "font_size", 18)
-        except Exception:
-            pass
-
-        # Propagate font settings
-        if hasattr(self, 'walk'):
-            for child in self.walk():
-                if hasattr(child, 'font_name') and self.font_family:
-                    child.font_name = self.font_family
+        app = self._app
+        if app is not None:
+            self.font_family = getattr(app, "font_family", "Rubik")
+            self.font_size = getattr(app, "font_size", 18)
+            app.bind(font_family=self._on_app_font, font_size=self._on_app_font)
 
-                if (
+        self._apply_fonts()
+
+    def on_dismiss(self):
+        app = self._app
+        if app is not None:
+            app.unbind(font_family=self._on_app_font, font_size=self._on_app_font)
+
+    def _on_app_font(self, app, value):
+        self.font_family = app.font_family
+        self.font_size = app.font_size
+        self._apply_fonts()
+
+    def _apply_fonts(self):
+        """Propagate font settings to the cached text widgets."""
+        if self._font_targets is None:
+            targets = []
+            for child in self.walk():
+                gets_name = hasattr(child, 'font_name')
+                gets_size = (
                     hasattr(child, 'font_size')
                     and hasattr(child, 'text')
                     and not isinstance(child, Button)
-                ):
-                    child.font_size = dp(self.font_size)
+                )
+                if gets_name or gets_size:
+                    targets.append((child, gets_name, gets_size))
+            self._font_targets = tuple(targets)
+
+        font_family = self.font_family
+        font_px = dp(self.font_size)
+        for child, gets_name, gets_size in self._font_targets:
+            if gets_name and font_family:
+                child.font_name = font_family
+            if gets_size:
+                child.font_size = font_px
 
 
 class AddTaskPopup(BasePopup):
@@ -68,8 +96,7 @@ class AddTaskPopup(BasePopup):
 
     def _validate_time(self, time_str):
         """Validate time format HH:MM (kept for future use if needed)."""
-        pattern = r'^([0-1]?[-9]|2[0-3]):([0-5][0-9])$'
-        return re.match(pattern, time_str) is not None
+        return _TIME_RE.match(time_str) is not None
 
 
 class ConfirmationPopup(BasePopup):
@@ -92,6 +119,7 @@ class ListeningPopup(BasePopup):
         self.auto_dismiss = False
 
     def on_dismiss(self):
+        super().on_dismiss()
         if self.dismiss_callback:
             self.dismiss_callback()
 
@@ -1,13 +1,49 @@
 import logging
+import weakref
+from typing import NamedTuple
 from kivy.uix.screenmanager import Screen
-from kivy.properties import NumericProperty, StringProperty, BooleanProperty
+from kivy.properties import NumericProperty, StringProperty, BooleanProperty, AliasProperty
 from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.uix.button import Button  # for font-size exclusion
-from .popups import SettingsConfirmationPopup, DefaultSettingsPopup
+
+
+class SettingsSnapshot(NamedTuple):
+    """The user-facing settings, read from the app in one call."""
+    font_size: int = 20
+    font_family: str = 'Rubik'
+    high_contrast: bool = False
+    current_voice: int = 0
+    voice_speed: str = 'Normal'
+
+
+DEFAULT_SETTINGS = SettingsSnapshot()
+
+# Font size label text; %d truncates like the int() it replaces
+_PX_FMT = "%d Px".__mod__
 
 
 class SettingsScreen(Screen):
+    # Voice speed slider positions 0/1/2 and their inverse
+    _SPEED_LABELS = ('Slow', 'Normal', 'Fast')
+    _SPEED_INDEX = {'Slow': 0, 'Normal': 1, 'Fast': 2}
+    _SPEED_RATES = {'Slow': 150, 'Normal': 200, 'Fast': 250}
+    _VOICE_NAMES = ("Eddy", "Karen", "Tessa", "GrandPa")
+    # Memoized by get_voice_labels; a class default because KV asks for the
+    # labels while the base __init__ is still applying rules
+    _voice_labels = None
+    # Widgets from the KV rule, bound in on_kv_post (which runs inside the
+    # base __init__, so these defaults live on the class too)
+    _font_slider = None
+    _voice_slider = None
+    _contrast_btn = None
+    _font_label = None
+    # Set while we write several properties at once; handlers and the
+    # preview wait for the single refresh at the end
+    _suppress = False
+    # Weak so the screen doesn't hold the app -> screen_manager -> screen cycle
+    _app_ref = None
+
     # App-facing properties
     font_size = NumericProperty()
     font_family = StringProperty()
@@ -15,40 +51,91 @@ class SettingsScreen(Screen):
     current_voice = NumericProperty(0)
     voice_speed = StringProperty('Normal')
 
+    def _get_speed_index(self):
+        return self._SPEED_INDEX.get(self.voice_speed, 2)
+
+    # Voice speed slider position for voice_speed (unknown labels sit at Fast)
+    speed_index = AliasProperty(_get_speed_index, None, bind=('voice_speed',), cache=True)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.app = None
-        Clock.schedule_once(self._post_init, 0.1)
+        # TTS engine and its rate hooks, resolved once in set_app_instance
+        self._tts = None
+        self._tts_set_rate = None
+        self._tts_speak_with_rate = None
+        # App settings as of the last _sync_from_app
+        self._last_synced = None
+        # (font_name widgets, font_size widgets), collected on first preview
+        self._font_targets = None
+        # Slider drags fire many times per frame; restyle at most once per frame
+        self._font_preview_trigger = Clock.create_trigger(self._do_font_preview, 0)
+        # Spoken previews wait for the control to settle; only the last one plays
+        self._tts_preview_trigger = Clock.create_trigger(self._run_tts_preview, 0.25)
+        self._pending_tts_preview = None
 
     # ----- Lifecycle / Sync -----
+    @property
+    def app(self):
+        ref = self._app_ref
+        return ref() if ref is not None else None
+
+    @app.setter
+    def app(self, app_instance):
+        self._app_ref = weakref.ref(app_instance) if app_instance is not None else None
+
     def set_app_instance(self, app_instance):
         self.app = app_instance
+        self._tts = getattr(app_instance, 'tts_engine', None)
+        self._tts_set_rate = getattr(self._tts, 'set_rate', None)
+        self._tts_speak_with_rate = getattr(self._tts, 'speak_with_rate', None)
+        self._voice_labels = None
         if self.app:
             self._sync_from_app()
 
-    def _post_init(self, _dt):
-        if self.app:
-            self._sync_from_app()
+    def on_kv_post(self, base_widget):
+        ids = self.ids
+        self._font_slider = ids.get('font_size_slider')
+        self._voice_slider = ids.get('voice_speed_slider')
+        self._contrast_btn = ids.get('contrast_btn')
+        self._font_label = ids.get('font_size_label')
 
     def _sync_from_app(self):
         """Pull current settings from the app object."""
-        self.font_size = getattr(self.app, 'font_size', 20)
-        self.font_family = getattr(self.app, 'font_family', 'Rubik')
-        self.high_contrast = getattr(self.app, 'high_contrast', False)
-        self.current_voice = getattr(self.app, 'current_voice', 0)
-        self.voice_speed = getattr(self.app, 'voice_speed', 'Normal')
-
-        if hasattr(self, 'ids'):
-            if 'font_size_slider' in self.ids:
-                self.ids.font_size_slider.value = self.font_size
-            if 'voice_speed_slider' in self.ids:
-                self.ids.voice_speed_slider.value = 1 if self.voice_speed == 'Normal' else (
-                    0 if self.voice_speed == 'Slow' else 2
-                )
-            if 'contrast_btn' in self.ids:
-                self.ids.contrast_btn.text = 'ON' if self.high_contrast else 'OFF'
-            if 'font_size_label' in self.ids:
-                self.ids.font_size_label.text = f'{int(self.font_size)} Px'
+        app = self.app
+        get_snapshot = getattr(app, 'get_settings_snapshot', None)
+        if get_snapshot is not None:
+            snapshot = get_snapshot()
+        else:
+            snapshot = SettingsSnapshot(*(
+                getattr(app, field, default)
+                for field, default in zip(SettingsSnapshot._fields, DEFAULT_SETTINGS)
+            ))
+        current = (
+            self.font_size, self.font_family, self.high_contrast,
+            self.current_voice, self.voice_speed,
+        )
+        # Same app state and no unsaved edits on screen: nothing to push
+        if snapshot == self._last_synced and snapshot == current:
+            return
+        self._last_synced = snapshot
+        self._suppress = True
+        try:
+            (
+                self.font_size, self.font_family, self.high_contrast,
+                self.current_voice, self.voice_speed,
+            ) = snapshot
+
+            if self._font_slider is not None:
+                self._font_slider.value = self.font_size
+            if self._voice_slider is not None:
+                self._voice_slider.value = self.speed_index
+            if self._contrast_btn is not None:
+                self._contrast_btn.text = 'ON' if self.high_contrast else 'OFF'
+            if self._font_label is not None:
+                self._font_label.text = _PX_FMT(self.font_size)
+        finally:
+            self._suppress = False
 
         # Apply preview to this screen only
         self.apply_font_preview()
@@ -56,9 +143,13 @@ class SettingsScreen(Screen):
     # ----- Handlers (KV binds to these) -----
     def on_font_size_change(self, _slider, value):
         """Change font size with live preview."""
-        self.font_size = int(value)
-        if hasattr(self, 'ids') and 'font_size_label' in self.ids:
-            self.ids.font_size_label.text = f'{int(value)} Px'
+        if self._suppress:
+            return
+        px = int(value)
+        # Sub-pixel slider travel (and the KV echo of our own update) is a no-op
+        if px == self.font_size:
+            return
+        self.font_size = px
         self.apply_font_preview()
 
     def on_font_family_change(self, _btn, text):
@@ -66,6 +157,33 @@ class SettingsScreen(Screen):
         self.font_family = text
         self.apply_font_preview()
 
+    def add_widget(self, widget, *args, **kwargs):
+        self._font_targets = None
+        return super().add_widget(widget, *args, **kwargs)
+
+    def remove_widget(self, widget, *args, **kwargs):
+        self._font_targets = None
+        return super().remove_widget(widget, *args, **kwargs)
+
+    def _collect_font_targets(self):
+        """
+        Walk the tree once and split the widgets _apply_font_to_children
+        styles into a font_name list and a font_size list. The settings
+        layout is static, so this only reruns if the screen's children change.
+        """
+        name_targets = []
+        size_targets = []
+        for child in self.walk():
+            if hasattr(child, 'font_name'):
+                name_targets.append(child)
+            if (
+                hasattr(child, 'font_size')
+                and hasattr(child, 'text')
+                and not isinstance(child, Button)
+            ):
+                size_targets.append(child)
+        self._font_targets = (name_targets, size_targets)
+
     def _apply_font_to_children(self):
         """
         Apply current font family + size to all child widgets on this screen.
@@ -76,19 +194,27 @@ class SettingsScreen(Screen):
         if not hasattr(self, 'walk'):
             return
 
-        for child in self.walk():
-            if hasattr(child, 'font_name') and self.font_family:
-                child.font_name = self.font_family
+        if self._font_targets is None:
+            self._collect_font_targets()
 
-            if (
-                hasattr(child, 'font_size')
-                and hasattr(child, 'text')
-                and not isinstance(child, Button)
-            ):
-                child.font_size = dp(self.font_size)
+        name_targets, size_targets = self._font_targets
+        font_family = self.font_family
+        if font_family:
+            for child in name_targets:
+                child.font_name = font_family
+        font_px = dp(self.font_size)
+        for child in size_targets:
+            child.font_size = font_px
 
     def apply_font_preview(self):
-        """Live preview of font settings within SettingsScreen."""
+        """Live preview of font settings within SettingsScreen (coalesced per frame)."""
+        if self._suppress:
+            return
+        self._font_preview_trigger()
+
+    def _do_font_preview(self, _dt):
+        if self._font_label is not None:
+            self._font_label.text = _PX_FMT(self.font_size)
         self._apply_font_to_children()
 
     def on_contrast_toggle(self, btn):
@@ -102,21 +228,24 @@ class SettingsScreen(Screen):
         btn.text = 'ON' if self.high_contrast else 'OFF'
 
     def get_voice_labels(self):
-        """Get dynamic voice labels based on available TTS voices."""
+        """Get dynamic voice labels based on available TTS voices (computed once per app)."""
+        if self._voice_labels is not None:
+            return self._voice_labels
+
         from kivy.app import App
 
         try:
             app = App.get_running_app()
             if hasattr(app, 'tts_engine'):
-                result = ["Eddy", "Karen", "Tessa", "GrandPa"]
-                return result
+                self._voice_labels = self._VOICE_NAMES
+                return self._voice_labels
             else:
                 print("DEBUG: No tts_engine found")
         except Exception as e:
             print(f"DEBUG: Error in get_voice_labels: {e}")
 
-        fallback = ["Eddy", "Karen", "Tessa", "GrandPa"]
-        return fallback
+        self._voice_labels = self._VOICE_NAMES
+        return self._voice_labels
 
     def on_voice_change(self, _btn, voice_index: int):
         """Voice changed - use index directly, with live preview."""
@@ -125,84 +254,111 @@ class SettingsScreen(Screen):
         voice_names = self.get_voice_labels()
         voice_name = voice_names[voice_index] if voice_index < len(voice_names) else f"Voice {voice_index + 1}"
 
-        if self.app and hasattr(self.app, 'tts_engine'):
+        tts = self._tts
+        if tts:
             try:
-                self.app.tts_engine.set_voice(voice_index)
-                Clock.schedule_once(lambda dt: self.app.tts_engine.speak(f"This is {voice_name}"), 0.1)
+                tts.set_voice(voice_index)
+                self._schedule_tts_preview(tts.speak, f"This is {voice_name}")
             except Exception as e:
                 logging.debug(f"Voice preview failed: {e}")
 
+    def _schedule_tts_preview(self, func, arg):
+        """Debounce a spoken preview: restart the timer and keep only the latest call."""
+        self._pending_tts_preview = (func, arg)
+        self._tts_preview_trigger.cancel()
+        self._tts_preview_trigger()
+
+    def _run_tts_preview(self, _dt):
+        pending, self._pending_tts_preview = self._pending_tts_preview, None
+        if pending is None:
+            return
+        func, arg = pending
+        try:
+            func(arg)
+        except Exception as e:
+            logging.debug(f"Voice preview failed: {e}")
+
     def _preview_voice(self, voice_name):
         """Preview selected voice (kept for backward compatibility)."""
         try:
-            self.app.tts_engine.set_voice(self.current_voice)
-            self.app.tts_engine.speak(f"This is voice {voice_name}")
+            self._tts.set_voice(self.current_voice)
+            self._tts.speak(f"This is voice {voice_name}")
         except Exception as e:
             logging.debug(f"Voice preview failed: {e}")
 
     def on_voice_speed_change(self, _spinner, text):
         """Backward-compat if Spinner is used."""
         self.voice_speed = text
-        self._preview_speed(text)
+        self._schedule_tts_preview(self._preview_speed, text)
 
     def on_voice_speed_slider(self, _slider, position: int):
         """Map 0/1/2 slider -> Slow/Normal/Fast."""
-        mapped = {0: 'Slow', 1: 'Normal', 2: 'Fast'}.get(position, 'Normal')
+        if self._suppress:
+            return
+        mapped = self._SPEED_LABELS[position] if 0 <= position < 3 else 'Normal'
         self.voice_speed = mapped
-        self._preview_speed(mapped)
+        self._schedule_tts_preview(self._preview_speed, mapped)
 
     def _preview_speed(self, speed_label: str):
         """
         Preview the selected speed, without permanently altering base rate.
         """
-        if not (self.app and hasattr(self.app, 'tts_engine')):
+        engine = self._tts
+        if not engine:
+            return
+        phrase = f"This is {speed_label} speed"
+        rate = self._SPEED_RATES.get(speed_label, 200)
+        if self._tts_speak_with_rate:
+            # One call; the engine's configured rate is never changed
+            self._tts_speak_with_rate(phrase, rate)
+            return
+
+        set_rate = self._tts_set_rate
+        if not set_rate:
             return
-        engine = self.app.tts_engine
         original_rate = getattr(engine, 'rate', 200)
         try:
-            if speed_label == 'Slow':
-                engine.set_rate(150)
-            elif speed_label == 'Fast':
-                engine.set_rate(250)
-            else:
-                engine.set_rate(200)
-            engine.speak(f"This is {speed_label} speed")
+            set_rate(rate)
+            engine.speak(phrase)
         except Exception:
             pass
         finally:
             try:
-                engine.set_rate(original_rate)
+                set_rate(original_rate)
             except Exception:
                 pass
 
     # ----- Actions -----
     def reset_to_default(self):
         """Reset all settings to their defaults and show a confirmation popup."""
-        self.font_size = 20
-        self.font_family = 'Rubik'
-        self.high_contrast = False
-        self.current_voice = 0
-        self.voice_speed = 'Normal'
-
-        if hasattr(self, 'ids'):
-            if 'font_size_slider' in self.ids:
-                self.ids.font_size_slider.value = self.font_size
-            if 'voice_speed_slider' in self.ids:
-                self.ids.voice_speed_slider.value = 1
-            if 'contrast_btn' in self.ids:
-                self.ids.contrast_btn.text = 'OFF'
-            if 'font_size_label' in self.ids:
-                self.ids.font_size_label.text = f'{self.font_size} Px'
+        self._suppress = True
+        try:
+            (
+                self.font_size, self.font_family, self.high_contrast,
+                self.current_voice, self.voice_speed,
+            ) = DEFAULT_SETTINGS
+
+            if self._font_slider is not None:
+                self._font_slider.value = self.font_size
+            if self._voice_slider is not None:
+                self._voice_slider.value = 1
+            if self._contrast_btn is not None:
+                self._contrast_btn.text = 'OFF'
+            if self._font_label is not None:
+                self._font_label.text = _PX_FMT(self.font_size)
+        finally:
+            self._suppress = False
 
         self.apply_font_preview()
 
+        from .popups import DefaultSettingsPopup
         popup = DefaultSettingsPopup()
         popup.title = 'Default Settings'
         popup.confirmation_text = 'Default settings saved'
         popup.open()
 
-        if self.app and getattr(self.app, 'tts_engine', None):
-            self.app.tts_engine.speak("Default settings restored")
+        if self._tts:
+            self._tts.speak("Default settings restored")
 
     def save_settings(self):
         """Persist settings to the app and apply globally."""
@@ -218,11 +374,12 @@ class SettingsScreen(Screen):
             except Exception as e:
                 logging.error(f"Error applying global settings: {e}")
 
+            from .popups import SettingsConfirmationPopup
             popup = SettingsConfirmationPopup()
             popup.open()
 
-            if getattr(self.app, "tts_engine", None):
-                self.app.tts_engine.speak("Settings saved")
+            if self._tts:
+                self._tts.speak("Settings saved")
 
         logging.info(
             f"Settings saved - Font: {self.font_family} {self.font_size}px, "
@@ -235,6 +392,11 @@ class SettingsScreen(Screen):
         Called from app.apply_settings_globally() to propagate settings
         back into this screen.
         """
+        if (font_family, font_size, high_contrast) == (
+            self.font_family, self.font_size, self.high_contrast
+        ):
+            # Usually the case right after our own save_settings
+            return
         self.font_family = font_family
         self.font_size = font_size
         self.high_contrast = high_contrast
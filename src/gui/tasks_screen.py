@@ -3,7 +3,7 @@ from kivy.uix.screenmanager import Screen
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.properties import StringProperty, NumericProperty, BooleanProperty
+from kivy.properties import StringProperty, NumericProperty, BooleanProperty, ObjectProperty
 from kivy.clock import Clock
 from kivy.metrics import dp
 
@@ -11,26 +11,27 @@ logger = logging.getLogger(__name__)
 
 
 class TaskListItem(BoxLayout):
+    """All-tasks row; forwards its button events to the owning TasksScreen."""
     __events__ = ('on_delete', 'on_complete')
     text = StringProperty("")
     task_id = NumericProperty(0)
     font_size = NumericProperty()
     font_family = StringProperty()
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    owner = ObjectProperty(None, allownone=True)
 
     def delete_task(self):
         self.dispatch('on_delete', self.task_id)
 
-    def on_delete(self, *args):
-        pass
+    def on_delete(self, task_id):
+        if self.owner:
+            self.owner.delete_task(self, task_id)
 
     def mark_done(self):
         self.dispatch('on_complete', self.task_id)
 
-    def on_complete(self, *args):
-        pass
+    def on_complete(self, task_id):
+        if self.owner:
+            self.owner.mark_done(self, task_id)
 
 
 class TasksScreen(Screen):
@@ -41,6 +42,17 @@ class TasksScreen(Screen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.app = None
+        # (font_name targets, font_size targets); rebuilt when the task rows change
+        self._font_targets = None
+        self._last_settings = None
+        # Restyle at most once per frame however many changes arrive
+        self._font_trigger = Clock.create_trigger(self._apply_font_to_children, 0)
+        # app.tasks_version the rows on screen reflect
+        self.tasks_version_seen = 0
+        # Rows on screen in display order, plus detached rows kept for reuse
+        self._task_items = []
+        self._item_pool = []
+        self._empty_label = None
         Clock.schedule_once(self._post_init, 0.1)
 
     def set_app_instance(self, app_instance):
@@ -53,93 +65,133 @@ class TasksScreen(Screen):
     def _post_init(self, dt):
         if self.app:
             self.load_all_tasks()
-        Clock.schedule_once(lambda _dt: self._apply_font_to_children(), 0.2)
+        self._font_trigger()
 
-    def _apply_font_to_children(self):
+    def _collect_font_targets(self):
         """
-        Apply font family and size across TasksScreen.
-        - font_family applies everywhere
-        - font_size does not affect Buttons or labels inside Buttons
+        Walk the tree once and split the widgets _apply_font_to_children
+        styles into a font_name list and a font_size list.
         """
-        if not hasattr(self, 'walk'):
-            return
-
+        name_targets = []
+        size_targets = []
         for child in self.walk():
-            # Apply font family everywhere
-            if hasattr(child, 'font_name') and self.font_family:
-                child.font_name = self.font_family
-
-            # Apply font size except on Buttons and their direct child labels
+            if hasattr(child, 'font_name'):
+                name_targets.append(child)
+            # Font size skips Buttons and their direct child labels
             if (
                 hasattr(child, 'font_size')
                 and hasattr(child, 'text')
                 and not isinstance(child, Button)
                 and not isinstance(getattr(child, 'parent', None), Button)
             ):
-                child.font_size = dp(self.font_size)
+                size_targets.append(child)
+        self._font_targets = (name_targets, size_targets)
+
+    def _apply_font_to_children(self, *_args):
+        """
+        Apply font family and size across TasksScreen.
+        - font_family applies everywhere
+        - font_size does not affect Buttons or labels inside Buttons
+        """
+        if not hasattr(self, 'walk'):
+            return
+
+        if self._font_targets is None:
+            self._collect_font_targets()
+
+        name_targets, size_targets = self._font_targets
+        font_family = self.font_family
+        if font_family:
+            for child in name_targets:
+                child.font_name = font_family
+        font_px = dp(self.font_size)
+        for child in size_targets:
+            child.font_size = font_px
 
     def load_all_tasks(self):
         if not self.app:
             return
         try:
-            tasks = self.app.db_manager.get_all_tasks()
-            tasks = self.sort_tasks_by_time(tasks)
-            # Only display non-completed tasks
-            tasks = [t for t in tasks if not t.is_completed]
+            # SQLite filters out completed tasks and orders by due_minutes
+            tasks = self.app.db_manager.get_pending_tasks()
             self.update_tasks_display(tasks)
         except Exception as e:
             logging.error(f"Error loading tasks: {e}")
 
-    def sort_tasks_by_time(self, tasks):
-        def time_to_minutes(time_str: str) -> int:
-            try:
-                t = time_str.upper().replace(' ', '')
-                if 'AM' in t or 'PM' in t:
-                    part = t.replace('AM', '').replace('PM', '')
-                    hours, minutes = map(int, part.split(':'))
-                    if 'PM' in t and hours != 12:
-                        hours += 12
-                    if 'AM' in t and hours == 12:
-                        hours = 0
-                    return hours * 60 + minutes
-                else:
-                    hours, minutes = map(int, t.split(':'))
-                    return hours * 60 + minutes
-            except Exception:
-                return 0
-
-        return sorted(tasks, key=lambda x: time_to_minutes(x.due_time))
-
     def update_tasks_display(self, tasks):
+        """
+        Show `tasks` in the grid, reusing the existing rows in place.
+        Only the difference in row count is added or removed; surplus
+        rows are parked in a pool for the next refresh.
+        """
         if not hasattr(self, 'ids') or 'all_tasks_grid' not in self.ids:
             return
 
         grid = self.ids.all_tasks_grid
-        grid.clear_widgets()
+        items = self._task_items
+        pool = self._item_pool
+        row_count = len(items)
+
+        # Surplus rows go back to the pool
+        while len(items) > len(tasks):
+            item = items.pop()
+            grid.remove_widget(item)
+            pool.append(item)
 
         if not tasks:
-            empty_label = Label(
-                text="No tasks yet",
-                font_size=dp(self.font_size),
-                font_name=self.font_family,
-                color=(0.5, 0.5, 0.5, 1),
-                size_hint_y=None,
-                height=dp(100),
-                halign='center'
-            )
-            grid.add_widget(empty_label)
+            empty_label = self._empty_label
+            if empty_label is None:
+                empty_label = self._empty_label = Label(
+                    text="No tasks yet",
+                    color=(0.5, 0.5, 0.5, 1),
+                    size_hint_y=None,
+                    height=dp(100),
+                    halign='center'
+                )
+            empty_label.font_size = dp(self.font_size)
+            empty_label.font_name = self.font_family
+            if empty_label.parent is None:
+                grid.add_widget(empty_label)
+                self._font_targets = None
             return
 
-        for task in tasks:
-            item = TaskListItem(
-                text=f"{task.title}\nAt: {task.due_time}",
-                task_id=task.id,
-                font_family=self.font_family,
-                font_size=self.font_size
-            )
-            item.bind(on_delete=self.delete_task)
-            item.bind(on_complete=self.mark_done)
-            grid.add_widget(item)
+        if self._empty_label is not None and self._empty_label.parent is not None:
+            grid.remove_widget(self._empty_label)
+            self._font_targets = None
+
+        font_family = self.font_family
+        font_size = self.font_size
+        for index, task in enumerate(tasks):
+            if index < len(items):
+                item = items[index]
+            else:
+                item = pool.pop() if pool else self._create_task_item()
+                items.append(item)
+                grid.add_widget(item)
+            item.text = f"{task.title}\nAt: {task.due_time}"
+            item.task_id = task.id
+            item.font_family = font_family
+            item.font_size = font_size
+
+        if len(items) != row_count:
+            # The cached font targets no longer match the rows on screen
+            self._font_targets = None
+            self._font_trigger()
+
+    def _restyle_task_items(self):
+        """Push the current font onto every row, pooled ones included, and the empty label."""
+        font_family = self.font_family
+        font_size = self.font_size
+        for item in self._task_items + self._item_pool:
+            item.font_family = font_family
+            item.font_size = font_size
+        if self._empty_label is not None:
+            self._empty_label.font_size = dp(font_size)
+            self._empty_label.font_name = font_family
+
+    def _create_task_item(self):
+        """New TaskListItem that reports its button events to this screen."""
+        return TaskListItem(owner=self)
 
     def delete_task(self, instance, task_id):
         if not self.app:
@@ -148,13 +200,8 @@ class TasksScreen(Screen):
             if self.app.db_manager.delete_task(task_id):
                 self.load_all_tasks()
 
-                # Keep MainScreen in sync
-                try:
-                    main_screen = self.app.screen_manager.get_screen('main')
-                    if hasattr(main_screen, 'load_tasks'):
-                        main_screen.load_tasks()
-                except Exception:
-                    pass
+                # MainScreen reloads on its next on_enter
+                self.app.mark_tasks_dirty(source=self)
 
                 if getattr(self.app, "tts_engine", None):
                     self.app.tts_engine.speak("Task deleted")
@@ -174,13 +221,8 @@ class TasksScreen(Screen):
             if self.app.db_manager.mark_done(task_id):
                 self.load_all_tasks()
 
-                # Keep MainScreen in sync
-                try:
-                    main_screen = self.app.screen_manager.get_screen('main')
-                    if hasattr(main_screen, 'load_tasks'):
-                        main_screen.load_tasks()
-                except Exception:
-                    pass
+                # MainScreen reloads on its next on_enter
+                self.app.mark_tasks_dirty(source=self)
 
                 if getattr(self.app, "tts_engine", None):
                     self.app.tts_engine.speak("Task Done")
@@ -198,12 +240,18 @@ class TasksScreen(Screen):
 
     def apply_settings(self, font_family, font_size, high_contrast):
         """Apply settings to TasksScreen."""
+        settings = (font_family, font_size, high_contrast)
+        if settings == self._last_settings:
+            return
+        self._last_settings = settings
         print(f"🔧 TasksScreen: Applying settings - {font_family} {font_size}px, Contrast: {high_contrast}")
         self.font_family = font_family
         self.font_size = font_size
         self.high_contrast = high_contrast
-        self._apply_font_to_children()
-        self.load_all_tasks()
+        # Only fonts changed: restyle the rows in place, no DB round-trip
+        self._restyle_task_items()
+        self.refresh_tasks_if_dirty()
+        self._font_trigger()
 
     def refresh_with_settings(self, font_family, font_size, high_contrast):
         self.apply_settings(font_family, font_size, high_contrast)
@@ -212,5 +260,13 @@ class TasksScreen(Screen):
         if self.app:
             self.app.show_main_screen()
 
-    def on_enter(self):
+    def refresh_tasks_if_dirty(self):
+        """Reload tasks only if they changed since this screen last showed them."""
+        app = self.app
+        if not app or self.tasks_version_seen == app.tasks_version:
+            return
+        self.tasks_version_seen = app.tasks_version
         self.load_all_tasks()
+
+    def on_enter(self):
+        self.refresh_tasks_if_dirty()
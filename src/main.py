@@ -1,8 +1,7 @@
 import logging
 import os
-import threading
-import time
 from datetime import datetime, timedelta
+from functools import partial
 
 # Ensure local packages are defined early based on project structure
 current_dir = os.path.dirname(__file__)
@@ -12,15 +11,16 @@ project_root = os.path.dirname(current_dir)
 from .voice.stt_engine import SpeechToTextEngine
 from .gui.main_screen import MainScreen
 from .gui.tasks_screen import TasksScreen
-from .gui.settings_screen import SettingsScreen
+from .gui.settings_screen import SettingsScreen, SettingsSnapshot
 from .voice.tts_engine import TextToSpeechEngine
 from .voice.command_parser import CommandParser
 from .data.database import DatabaseManager
+from .data.models import time_to_minutes
 from .security import SecurityManager
-from .gui.popups import AlarmPopup
 
 # Kivy imports
 from kivy.app import App
+from kivy.properties import StringProperty, NumericProperty, BooleanProperty
 from kivy.clock import Clock
 from kivy.uix.screenmanager import ScreenManager, Screen
 from kivy.core.text import LabelBase
@@ -54,73 +54,39 @@ logger = logging.getLogger(__name__)
 
 
 # Font registration
+# (name, path under assets/fonts, regular, bold, italic, bolditalic)
+FONT_SPECS = (
+    ('Rubik', ('Rubik', 'static'),
+     'Rubik-Regular.ttf', 'Rubik-Bold.ttf', 'Rubik-Italic.ttf', 'Rubik-BoldItalic.ttf'),
+    ('Arial', ('arial',),
+     'arial.ttf', 'arialbd.ttf', 'arialceitalic.ttf', None),
+    ('BalsamiqSans', ('Balsamiq_Sans',),
+     'BalsamiqSans-Regular.ttf', 'BalsamiqSans-Bold.ttf',
+     'BalsamiqSans-Italic.ttf', 'BalsamiqSans-BoldItalic.ttf'),
+    ('CrimsonPro', ('Crimson_pro', 'static'),
+     'CrimsonPro-Regular.ttf', 'CrimsonPro-Bold.ttf',
+     'CrimsonPro-Italic.ttf', 'CrimsonPro-Black.ttf'),
+)
+
+
 def register_application_fonts():
     """
     Register all application fonts.
     """
     try:
         abs_current_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_dir = os.path.join(os.path.dirname(abs_current_dir), 'assets')
-
-        rubik_dir = os.path.join(assets_dir, 'fonts', 'Rubik', 'static')
-        rubik_regular = os.path.join(rubik_dir, 'Rubik-Regular.ttf')
-        rubik_bold = os.path.join(rubik_dir, 'Rubik-Bold.ttf')
-        rubik_italic = os.path.join(rubik_dir, 'Rubik-Italic.ttf')
-        rubik_bolditalic = os.path.join(rubik_dir, 'Rubik-BoldItalic.ttf')
-
-        arial_dir = os.path.join(assets_dir, 'fonts', 'arial')
-        arial_regular = os.path.join(arial_dir, 'arial.ttf')
-        arial_bold = os.path.join(arial_dir, 'arialbd.ttf')
-        arial_italic = os.path.join(arial_dir, 'arialceitalic.ttf')
-
-        balsamiq_dir = os.path.join(assets_dir, 'fonts', 'Balsamiq_Sans')
-        balsamiq_regular = os.path.join(balsamiq_dir, 'BalsamiqSans-Regular.ttf')
-        balsamiq_bold = os.path.join(balsamiq_dir, 'BalsamiqSans-Bold.ttf')
-        balsamiq_italic = os.path.join(balsamiq_dir, 'BalsamiqSans-Italic.ttf')
-        balsamiq_bolditalic = os.path.join(balsamiq_dir, 'BalsamiqSans-BoldItalic.ttf')
-
-        crimson_dir = os.path.join(assets_dir, 'fonts', 'Crimson_pro', 'static')
-        crimson_regular = os.path.join(crimson_dir, 'CrimsonPro-Regular.ttf')
-        crimson_bold = os.path.join(crimson_dir, 'CrimsonPro-Bold.ttf')
-        crimson_italic = os.path.join(crimson_dir, 'CrimsonPro-Italic.ttf')
-        crimson_black = os.path.join(crimson_dir, 'CrimsonPro-Black.ttf')
-
-        print("🔍 Checking font paths:")
-        print(f"Rubik Regular: {os.path.exists(rubik_regular)}")
-        print(f"Arial Regular: {os.path.exists(arial_regular)}")
-        print(f"Balsamiq Sans Regular: {os.path.exists(balsamiq_regular)}")
-        print(f"Crimson Pro Regular: {os.path.exists(crimson_regular)}")
-
-        LabelBase.register(
-            name='Rubik',
-            fn_regular=rubik_regular,
-            fn_bold=rubik_bold,
-            fn_italic=rubik_italic,
-            fn_bolditalic=rubik_bolditalic
-        )
-
-        LabelBase.register(
-            name='Arial',
-            fn_regular=arial_regular,
-            fn_bold=arial_bold,
-            fn_italic=arial_italic
-        )
-
-        LabelBase.register(
-            name='BalsamiqSans',
-            fn_regular=balsamiq_regular,
-            fn_bold=balsamiq_bold,
-            fn_italic=balsamiq_italic,
-            fn_bolditalic=balsamiq_bolditalic
-        )
-
-        LabelBase.register(
-            name='CrimsonPro',
-            fn_regular=crimson_regular,
-            fn_bold=crimson_bold,
-            fn_italic=crimson_italic,
-            fn_bolditalic=crimson_black
-        )
+        fonts_dir = os.path.join(os.path.dirname(abs_current_dir), 'assets', 'fonts')
+
+        # LabelBase.register raises on a missing file, so no separate exists() checks
+        for name, subdir, regular, bold, italic, bolditalic in FONT_SPECS:
+            base = os.path.join(fonts_dir, *subdir)
+            LabelBase.register(
+                name=name,
+                fn_regular=os.path.join(base, regular),
+                fn_bold=os.path.join(base, bold),
+                fn_italic=os.path.join(base, italic),
+                fn_bolditalic=os.path.join(base, bolditalic) if bolditalic else None
+            )
         return True
 
     except Exception as e:
@@ -144,96 +110,79 @@ class AlarmManager:
     def __init__(self, app):
         self.app = app
         self.running = False
-        self.alarm_thread = None
-        self.active_alarms = {}
+        self._monitor_event = None
+        self.active_alarms = set()
+        # task.id -> alarm key; ids are never reused (AUTOINCREMENT)
+        self._alarm_keys = {}
+        # alarm key -> 5-minute re-trigger interval, cancelled on dismiss
+        self._retrigger_events = {}
 
     def start(self):
         if self.running:
             return
 
         self.running = True
-        self.alarm_thread = threading.Thread(target=self._monitor_tasks, daemon=True)
-        self.alarm_thread.start()
+        # Polled from the Kivy clock: DB lookups and popups stay on the main thread
+        self._monitor_event = Clock.schedule_interval(self._tick, 30)
+        Clock.schedule_once(self._tick)
         logging.info("Alarm system started")
 
     def stop(self):
         self.running = False
-        if self.alarm_thread:
-            self.alarm_thread.join(timeout=1.0)
+        if self._monitor_event is not None:
+            self._monitor_event.cancel()
+            self._monitor_event = None
+        for event in self._retrigger_events.values():
+            event.cancel()
+        self._retrigger_events.clear()
         logging.info("Alarm system stopped")
 
-    def _monitor_tasks(self):
-        while self.running:
-            try:
-                current_time = self._get_current_time()
-                tasks = self.app.db_manager.get_all_tasks()
-
-                for task in tasks:
-                    if self._should_trigger_alarm(task, current_time):
-                        self._trigger_alarm(task)
+    def _tick(self, dt):
+        if not self.running:
+            return
+        try:
+            current_minutes = self._current_minutes()
+            # Indexed lookup: usually zero rows, instead of every task
+            tasks = self.app.db_manager.get_pending_tasks_at(current_minutes)
 
-                time.sleep(30)
+            # Still run the full check on the few candidates: it holds the
+            # active_alarms dedup
+            for task in tasks:
+                if self._should_trigger_alarm(task, current_minutes):
+                    self._trigger_alarm(task)
 
-            except Exception as e:
-                logging.error(f"Alarm monitor error: {e}")
-                time.sleep(60)
+        except Exception as e:
+            logging.error(f"Alarm monitor error: {e}")
 
-    def _get_current_time(self):
-        """
-        Return current time as a string like '6:35 PM'
-        (no leading zero on hour, AM/PM in upper case).
-        """
+    def _current_minutes(self):
+        """Current local time as minutes since midnight."""
         now = datetime.now()
-        return now.strftime("%I:%M %p").lstrip("0").upper() # '%I' gives 01–12, lstrip('0') removes leading 0 for 01–09
-
+        return now.hour * 60 + now.minute
 
     def _should_trigger_alarm(self, task, current_time):
         """
         Decide whether to trigger an alarm for this task at current_time.
 
+        current_time is minutes since midnight, or a time string in
+        any of the formats below.
+
         Supports formats like:
         - '06:35 PM', '6:35PM', '06:35PM', '6:35 pm', '6 PM'
         """
-        task_time_raw = (task.due_time or " ").upper().strip()
-        current_time_raw = (current_time or " ").upper().strip()
-
-        # Use the same alarm key style used in _trigger_alarm
-        alarm_key = f"{task.id}_{task_time_raw}"
-
         # Already active alarm? Then don't re-trigger from here.
-        if alarm_key in self.active_alarms:
+        if self._alarm_key(task) in self.active_alarms:
             return False
 
-        def to_minutes(t_str: str):
-            """
-            Convert a time string to minutes since midnight.
-            Returns None if parsing fails.
-
-            Handles:
-            - '6:35 PM', '06:35 PM', '6:35PM', '06:35PM', '6:35 pm'
-            - '6 PM'
-            - '18:35'
-            """
-            if not t_str:
-                return None
-
-            s = str(t_str).strip().upper()
-            s = s.replace(" ", "")  # Remove inner spaces: '6:35 PM' -> '6:35PM', '6 pm' -> '6PM'
-
-            formats = ["%I:%M%p", "%I%p", "%H:%M", "%H"] # Try several possible formats
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(s, fmt)
-                    return dt.hour * 60 + dt.minute
-                except ValueError:
-                    continue
-
-            logging.warning(f"Could not parse time string for alarm: '{t_str}' (normalized: '{s}')")
-            return None
-
         try:
-            task_minutes = to_minutes(task_time_raw)
-            current_minutes = to_minutes(current_time_raw)
+            task_minutes = task.due_minutes
+            if task_minutes is None:
+                # NULL in the DB already means unparseable; this only does
+                # real work for Task objects built without the column
+                task_minutes = time_to_minutes(task.due_time)
+            if isinstance(current_time, int):
+                current_minutes = current_time
+            else:
+                current_minutes = time_to_minutes(current_time)
 
             if task_minutes is None or current_minutes is None:
                 return False
@@ -244,11 +193,32 @@ class AlarmManager:
             logging.error(f"Error in _should_trigger_alarm: {e}")
             return False
 
+    def _alarm_key(self, task):
+        """'<id>_<DUE TIME>' key for active_alarms, built once per task."""
+        key = self._alarm_keys.get(task.id)
+        if key is None:
+            key = self._alarm_keys[task.id] = f"{task.id}_{(task.due_time or ' ').upper().strip()}"
+        return key
+
     def _trigger_alarm(self, task):
-        alarm_key = f"{task.id}_{task.due_time.upper().strip()}"
-        self.active_alarms[alarm_key] = True
+        alarm_key = self._alarm_key(task)
+        self.active_alarms.add(alarm_key)
 
-        Clock.schedule_once(lambda dt: self._show_alarm_popup(task, alarm_key))
+        # Already on the main thread (see _tick), so no hand-off is needed
+        self._show_alarm_popup(task, alarm_key)
+
+        # Re-check every 5 minutes until acknowledged; one event per alarm
+        if alarm_key not in self._retrigger_events:
+            self._retrigger_events[alarm_key] = Clock.schedule_interval(
+                partial(self._retrigger_if_active, task, alarm_key), 300
+            )
+
+    def _retrigger_if_active(self, task, alarm_key, dt):
+        if alarm_key not in self.active_alarms:
+            self._retrigger_events.pop(alarm_key, None)
+            return False  # Stops the interval
+        logging.info(f"Re-triggering alarm for task: {task.title}")
+        self._show_alarm_popup(task, alarm_key)
 
     def _show_alarm_popup(self, task, alarm_key):
         """
@@ -262,7 +232,7 @@ class AlarmManager:
             alarm_popup.open()
 
             # Auto-dismiss after 30 seconds if not acknowledged
-            Clock.schedule_once(lambda dt: alarm_popup.dismiss(), 30)
+            Clock.schedule_once(alarm_popup.dismiss, 30)
 
             if getattr(self.app, "tts_engine", None):
                 try:
@@ -272,14 +242,6 @@ class AlarmManager:
                 except Exception as e:
                     logging.error(f"Error in alarm TTS: {e}")
 
-            # Re-check in 5 minutes if not acknowledged
-            def retrigger_if_active(dt):
-                if alarm_key in self.active_alarms:
-                    logging.info(f"Re-triggering alarm for task: {task.title}")
-                    self._show_alarm_popup(task, alarm_key)
-
-            Clock.schedule_once(retrigger_if_active, 300)
-
         except Exception as e:
             logging.error(f"Error showing alarm popup: {e}")
 
@@ -293,42 +255,30 @@ class AlarmManager:
             self.app.db_manager.mark_done(task.id)
 
             # Remove from active alarms
-            if alarm_key in self.active_alarms:
-                del self.active_alarms[alarm_key]
-
-            # Refresh main screen
-            try:
-                main_screen = self.app.screen_manager.get_screen('main')
-                if hasattr(main_screen, 'load_tasks'):
-                    main_screen.load_tasks()
-            except Exception:
-                pass
-
-            # Refresh tasks screen 
-            try:
-                tasks_screen = self.app.screen_manager.get_screen('tasks') 
-                if hasattr(tasks_screen, 'load_all_tasks'):
-                    tasks_screen.load_all_tasks()
-            except Exception:
-                pass
-            
-            # Refresh settings screen
-            try:
-                settings_screen = self.app.screen_manager.get_screen('settings')
-                if hasattr(settings_screen, 'refresh_with_settings'):
-                    settings_screen.refresh_with_settings(
-                        self.app.font_family, 
-                        self.app.font_size, 
-                        self.app.high_contrast
-                    )
-            except Exception:
-                pass
+            self.active_alarms.discard(alarm_key)
+            self._alarm_keys.pop(task.id, None)
+            event = self._retrigger_events.pop(alarm_key, None)
+            if event is not None:
+                event.cancel()
+
+            # Visible screen refreshes now, the others on their next on_enter
+            self.app.mark_tasks_dirty()
 
         except Exception as e:
             logging.error(f"Error in handle_alarm_dismiss: {e}")
 
+
+# KV files already handed to Builder in this process
+_LOADED_KV = set()
+
+
 class VoiceAssistantApp(App):
     kv_file = None
+
+    # Global UI settings; properties so widgets and popups can bind to them
+    font_family = StringProperty('Rubik')
+    font_size = NumericProperty(20)
+    high_contrast = BooleanProperty(False)
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -348,6 +298,10 @@ class VoiceAssistantApp(App):
 
         # Track last reset date in-memory for safety
         self._last_reset_date = None
+        self._daily_reset_event = None
+
+        # Bumped on every task change; screens compare it to what they last loaded
+        self.tasks_version = 0
 
         self._schedule_daily_reset()
 
@@ -393,21 +347,30 @@ class VoiceAssistantApp(App):
         
         # Load individual KV files in correct order
         kv_files = [
-            'gui/popups.kv',      # Load first - popups might be referenced
-            'gui/main_screen.kv',
-            'gui/tasks_screen.kv', 
-            'gui/settings_screen.kv'
+            'popups.kv',      # Load first - popups might be referenced
+            'main_screen.kv',
+            'tasks_screen.kv',
+            'settings_screen.kv'
         ]
-        
+
+        # One directory read instead of an exists() call per file
+        gui_dir = os.path.join(current_dir, 'gui')
+        with os.scandir(gui_dir) as entries:
+            present = {entry.name for entry in entries}
+
         for kv_file in kv_files:
-            full_path = os.path.join(current_dir, kv_file)
-            if os.path.exists(full_path):
+            full_path = os.path.join(gui_dir, kv_file)
+            if full_path in _LOADED_KV:
+                # A second build()/run() in the same process would duplicate the rules
+                continue
+            if kv_file in present:
                 Builder.load_file(full_path)
-                print(f"✅ Loaded: {kv_file}")
+                _LOADED_KV.add(full_path)
+                print(f"✅ Loaded: gui/{kv_file}")
             else:
                 print(f"❌ Missing: {full_path}")
-        
-        
+
+
         self.screen_manager = ScreenManager()
         
         if not self._initialize_components():
@@ -444,22 +407,25 @@ class VoiceAssistantApp(App):
 
     def show_main_screen(self):
         """Show the main screen and refresh tasks."""
+        # MainScreen.on_enter reloads only if tasks changed meanwhile
         self.screen_manager.current = 'main'
-        main_screen = self.screen_manager.get_screen('main')
-        if hasattr(main_screen, 'load_tasks'):
-            main_screen.load_tasks()
 
     def show_tasks_screen(self):
         """Show all tasks screen and refresh tasks list."""
+        # TasksScreen.on_enter reloads only if tasks changed meanwhile
         self.screen_manager.current = 'tasks'
-        tasks_screen = self.screen_manager.get_screen('tasks')
-        if hasattr(tasks_screen, 'load_all_tasks'):
-            tasks_screen.load_all_tasks()
 
     def show_settings_screen(self):
         """Show settings screen."""
         self.screen_manager.current = 'settings'
 
+    def get_settings_snapshot(self):
+        """Current UI/voice settings as one SettingsSnapshot."""
+        return SettingsSnapshot(
+            self.font_size, self.font_family, self.high_contrast,
+            self.current_voice, self.voice_speed
+        )
+
     def apply_settings_globally(self):
         """
         Apply current settings to all screens.
@@ -472,31 +438,34 @@ class VoiceAssistantApp(App):
     # -------- Daily reset logic --------
     def _schedule_daily_reset(self):
         """
-        Background thread: waits until next midnight, then clears all tasks.
+        Schedule a Clock event for the next midnight that clears all tasks.
+        Nothing blocks while waiting, so shutdown is never held up.
         """
-        def reset_tasks():
-            while True:
-                try:
-                    now = datetime.now()
-                    today_str = now.strftime("%Y-%m-%d")
-                    self._last_reset_date = today_str
-
-                    next_midnight = (now + timedelta(days=1)).replace(
-                        hour=0, minute=0, second=0, microsecond=0
-                    )
-                    sleep_seconds = (next_midnight - now).total_seconds()
-                    logging.info(f"Daily reset scheduled in {sleep_seconds:.0f} seconds")
-                    time.sleep(sleep_seconds)
-
-                    self._reset_all_tasks()
-                    logging.info("Daily fresh start: All tasks cleared at midnight")
+        try:
+            now = datetime.now()
+            self._last_reset_date = now.strftime("%Y-%m-%d")
 
-                except Exception as e:
-                    logging.error(f"Daily reset error: {e}")
-                    time.sleep(3600)
+            next_midnight = (now + timedelta(days=1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            sleep_seconds = (next_midnight - now).total_seconds()
+            logging.info(f"Daily reset scheduled in {sleep_seconds:.0f} seconds")
+            self._daily_reset_event = Clock.schedule_once(
+                self._do_midnight_reset, sleep_seconds
+            )
+        except Exception as e:
+            logging.error(f"Daily reset error: {e}")
+            self._daily_reset_event = Clock.schedule_once(
+                lambda dt: self._schedule_daily_reset(), 3600
+            )
 
-        reset_thread = threading.Thread(target=reset_tasks, daemon=True)
-        reset_thread.start()
+    def _do_midnight_reset(self, dt):
+        try:
+            self._reset_all_tasks()
+            logging.info("Daily fresh start: All tasks cleared at midnight")
+        finally:
+            # Reschedule for the following midnight
+            self._schedule_daily_reset()
 
     def _reset_if_new_day(self):
         """
@@ -517,11 +486,8 @@ class VoiceAssistantApp(App):
         """Delete all tasks from DB and refresh UI."""
         try:
             if self.db_manager:
-                tasks = self.db_manager.get_all_tasks()
-                tasks_cleared = len(tasks)
-
-                for task in tasks:
-                    self.db_manager.delete_task(task.id)
+                # One DELETE statement instead of a fetch + per-row delete
+                tasks_cleared = self.db_manager.delete_all_tasks()
 
                 Clock.schedule_once(lambda dt: self._update_ui_after_reset(tasks_cleared))
                 logging.info(f"Midnight Reset: Cleared {tasks_cleared} tasks at reset point")
@@ -529,14 +495,20 @@ class VoiceAssistantApp(App):
             logging.error(f"Error in midnight reset: {e}")
 
     def _update_ui_after_reset(self, tasks_cleared):
-        main_screen = self.screen_manager.get_screen('main')
-        if hasattr(main_screen, 'load_tasks'):
-            main_screen.load_tasks()
+        self.mark_tasks_dirty()
 
-        if self.screen_manager.current == 'tasks':
-            tasks_screen = self.screen_manager.get_screen('tasks')
-            if hasattr(tasks_screen, 'load_all_tasks'):
-                tasks_screen.load_all_tasks()
+    def mark_tasks_dirty(self, source=None):
+        """
+        Record that tasks changed. `source` (a screen that already refreshed
+        itself) is marked current; the visible screen refreshes right away
+        and the rest wait for their next on_enter.
+        """
+        self.tasks_version += 1
+        if source is not None:
+            source.tasks_version_seen = self.tasks_version
+        screen = self.screen_manager.current_screen if self.screen_manager else None
+        if screen is not None and screen is not source and hasattr(screen, 'refresh_tasks_if_dirty'):
+            screen.refresh_tasks_if_dirty()
 
     def on_stop(self):
         """Clean up resources on app exit."""
@@ -546,6 +518,13 @@ class VoiceAssistantApp(App):
             self.tts_engine.stop()
         if self.alarm_manager:
             self.alarm_manager.stop()
+        if self._daily_reset_event is not None:
+            self._daily_reset_event.cancel()
+        if self.screen_manager and self.screen_manager.has_screen('main'):
+            # Drain MainScreen's DB worker before the connection goes away
+            self.screen_manager.get_screen('main').shutdown()
+        if self.db_manager:
+            self.db_manager.close()
 
 if __name__ == '__main__':
     VoiceAssistantApp().run()
\ No newline at end of file
@@ -105,6 +105,17 @@ class TextToSpeechEngine:
         - Uses a lock to serialize access to runAndWait().
         - On error, tries a one-time engine re-init and retry.
         """
+        self._speak(text)
+
+    def speak_with_rate(self, text: str, rate: int):
+        """
+        Speak one utterance at `rate`, leaving the configured rate untouched.
+        The override and restore happen under the speak lock, so no other
+        utterance can be spoken at the preview rate.
+        """
+        self._speak(text, rate)
+
+    def _speak(self, text: str, rate: int = None):
         try:
             if not self.engine:
                 logger.warning("TTS engine not available")
@@ -122,16 +133,23 @@ class TextToSpeechEngine:
                 time.sleep(0.3)
 
                 try:
+                    if rate is not None:
+                        self.engine.setProperty('rate', rate)
                     self.engine.say(text)
                     self.engine.runAndWait()
                 except Exception as e:
                     logger.warning(f"TTS run error, attempting one-time recovery: {e}")
                     self._recover_engine()
                     try:
+                        if rate is not None:
+                            self.engine.setProperty('rate', rate)
                         self.engine.say(text)
                         self.engine.runAndWait()
                     except Exception as e2:
                         logger.error(f"TTS speak failed after recovery: {e2}")
+                finally:
+                    if rate is not None and self.engine:
+                        self.engine.setProperty('rate', self.rate)
 
         except Exception as e:
             logger.error(f"Error in TTS speak: {e}")
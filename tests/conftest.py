@@ -28,4 +28,5 @@ def sample_task():
 @pytest.fixture
 def test_db_manager():
     from src.data.database import DatabaseManager
-    return DatabaseManager(test_mode=True)
\ No newline at end of file
+    from src.security import SecurityManager
+    return DatabaseManager(SecurityManager(), test_mode=True)
\ No newline at end of file
@@ -19,6 +19,7 @@ class TestAlarmManager:
         task.id = 1
         task.title = "Take medicine"
         task.due_time = "10:00 AM"
+        task.due_minutes = None
         task.is_completed = False
         return task
 
@@ -57,7 +58,7 @@ class TestAlarmManager:
 
     @pytest.mark.integration
     def test_handle_alarm_dismiss(self, alarm_manager, sample_task):
-        alarm_manager.active_alarms = {"1_10:00 AM": True}
+        alarm_manager.active_alarms = {"1_10:00 AM"}
         alarm_manager.handle_alarm_dismiss(sample_task, "1_10:00 AM")
         alarm_manager.app.db_manager.mark_done.assert_called_once_with(1)
         assert "1_10:00 AM" not in alarm_manager.active_alarms
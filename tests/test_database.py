@@ -7,11 +7,13 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 from src.data.database import DatabaseManager
+from src.security import SecurityManager
+from src.data.models import time_to_minutes
 
 class TestDatabaseManager:
     @pytest.fixture
     def test_db_manager(self):
-        return DatabaseManager(test_mode=True)
+        return DatabaseManager(SecurityManager(), test_mode=True)
 
     @pytest.mark.integration
     def test_add_task(self, test_db_manager):
@@ -30,12 +32,10 @@ class TestDatabaseManager:
         """Verify tasks are stored encrypted"""
         test_db_manager.add_task("Secret meeting", "2:00 PM")
         
-        # Check raw database content is encrypted
-        conn = sqlite3.connect(test_db_manager.db_path)
-        cursor = conn.cursor()
-        cursor.execute("SELECT title_encrypted FROM tasks")
+        # Check raw database content is encrypted; ":memory:" is private to
+        # the manager's own connection, so read through that
+        cursor = test_db_manager._conn.execute("SELECT title_encrypted FROM tasks")
         encrypted_title = cursor.fetchone()[0]
-        conn.close()
         
         # Should not contain plain text
         assert "Secret" not in encrypted_title
@@ -57,6 +57,12 @@ class TestDatabaseManager:
         tasks_after = test_db_manager.get_all_tasks()
         assert len(tasks_after) == 0
 
+    @pytest.mark.integration
+    def test_delete_all_tasks(self, test_db_manager):
+        test_db_manager.add_tasks([("One", "9:00 AM"), ("Two", "10:00 AM")])
+        assert test_db_manager.delete_all_tasks() == 2
+        assert test_db_manager.get_all_tasks() == []
+
     @pytest.mark.integration
     def test_mark_done(self, test_db_manager):
         test_db_manager.add_task("Complete me", "12:00 PM")
@@ -64,4 +70,55 @@ class TestDatabaseManager:
         success = test_db_manager.mark_done(tasks[0].id)
         assert success is True
         updated_tasks = test_db_manager.get_all_tasks()
-        assert updated_tasks[0].is_completed is True
\ No newline at end of file
+        assert updated_tasks[0].is_completed is True
+
+    @pytest.mark.integration
+    def test_add_tasks_batch(self, test_db_manager):
+        inserted = test_db_manager.add_tasks([("Batch one", "9:00 AM"), ("Batch two", "10:00 AM")])
+        assert inserted == 2
+        titles = [t.title for t in test_db_manager.get_all_tasks()]
+        assert "Batch one" in titles
+        assert "Batch two" in titles
+
+    @pytest.mark.integration
+    def test_pending_tasks_ordered_by_due_time(self, test_db_manager):
+        test_db_manager.add_task("Evening walk", "9:00 PM")
+        test_db_manager.add_task("Breakfast", "8:00 AM")
+        test_db_manager.add_task("Lunch", "12:30 PM")
+        tasks = test_db_manager.get_all_tasks()
+        test_db_manager.mark_done(tasks[1].id)
+        pending = [t.title for t in test_db_manager.get_pending_tasks()]
+        assert pending == ["Breakfast", "Evening walk"]
+
+    @pytest.mark.integration
+    def test_pending_tasks_at_minute(self, test_db_manager):
+        test_db_manager.add_task("Medicine", "6 PM")
+        test_db_manager.add_task("Walk", "6:00 PM")
+        test_db_manager.add_task("Lunch", "12:30 PM")
+        walk = [t for t in test_db_manager.get_all_tasks() if t.title == "Walk"][0]
+        test_db_manager.mark_done(walk.id)
+        due = test_db_manager.get_pending_tasks_at(18 * 60)
+        assert [t.title for t in due] == ["Medicine"]
+        assert due[0].due_minutes == 18 * 60
+
+    @pytest.mark.parametrize("due_time, minutes", [
+        ("12:00 AM", 0),
+        ("12:30 PM", 750),
+        ("1:05 pm", 785),
+        ("11:59 PM", 1439),
+        ("15:00", 900),
+        ("6 PM", 1080),
+        ("6:5 PM", 1085),
+        ("not a time", None),
+        ("13 PM", None),
+        ("25:00", None),
+        ("6:60 PM", None),
+    ])
+    def test_time_to_minutes(self, due_time, minutes):
+        assert time_to_minutes(due_time) == minutes
+
+    def test_unparseable_due_time_stores_null_minutes(self, test_db_manager):
+        assert test_db_manager.add_task("Someday", "whenever")
+        task = test_db_manager.get_all_tasks()[0]
+        assert task.due_minutes is None
+        assert test_db_manager.get_pending_tasks_at(0) == []
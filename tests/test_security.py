@@ -30,4 +30,4 @@ class TestSecurity:
     def test_secure_db_path(self, security_manager):
         path = security_manager.get_secure_db_path()
         assert "OfflineVoiceAssistant" in path
-        assert not path.startswith("/tmp")  # Not in temp directory
\ No newline at end of file
+        assert not path.startswith("/tmp")  # Not in temp directory